@@ -1,14 +1,416 @@
 # api/app.py
-from fastapi import FastAPI
+import io
+import os
+import time
+import asyncio
+import hashlib
+import logging
+import threading
+from decimal import Decimal
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 import duckdb
+import orjson
+import pyarrow as pa
+
+DUCKDB_PATH = os.getenv("OPENJORDI_DUCKDB_PATH", "openjordi.duckdb")
+DUCKDB_POOL_SIZE = int(os.getenv("OPENJORDI_DUCKDB_POOL_SIZE", "4"))
+DUCKDB_THREADS = int(os.getenv("OPENJORDI_DUCKDB_THREADS", "4"))
+DUCKDB_MEMORY_LIMIT = os.getenv("OPENJORDI_DUCKDB_MEMORY_LIMIT", "1GB")
+# Opt-in; needs the cache_prewarm extension installed beforehand (INSTALL cache_prewarm FROM community)
+DUCKDB_PREWARM = os.getenv("OPENJORDI_DUCKDB_PREWARM", "false").lower() in ["true", "1", "yes"]
+DUCKDB_PREWARM_LIMIT = os.getenv("OPENJORDI_DUCKDB_PREWARM_LIMIT")  # e.g. "512MB"
+DUCKDB_MAX_PREPARED = int(os.getenv("OPENJORDI_DUCKDB_MAX_PREPARED", "64"))  # per cursor, least recently used are deallocated
+STREAM_BATCH_SIZE = 8192
+GRANTS_PAGE_SIZE = 1000
+GRANTS_MAX_PAGE_SIZE = 10000
+RESPONSE_CACHE_TTL = float(os.getenv("OPENJORDI_RESPONSE_CACHE_TTL", "300"))  # seconds, 0 disables
+RESPONSE_CACHE_MAX_BYTES = int(os.getenv("OPENJORDI_RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))  # total, across all entries
+RESPONSE_CACHE_VERSION_INTERVAL = float(os.getenv("OPENJORDI_RESPONSE_CACHE_VERSION_INTERVAL", "10"))  # seconds between grants version checks
+
+logger = logging.getLogger("openjordi.api")
+
+
+class ConnectionPool:
+    """
+    Fixed-size pool of cursors sharing one long-lived read-only DuckDB connection.
+
+    Queries run on a dedicated executor with one worker per cursor, so database
+    parallelism is bounded independently of HTTP concurrency and the event loop
+    is never blocked on a scan.
+    """
+
+    def __init__(self, path, size, config=None):
+        self.conn = duckdb.connect(path, read_only=True, config=config or {})
+        self.executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="duckdb")
+        self._cursors = asyncio.Queue()
+        self._prepared = {}
+        for _ in range(size):
+            cursor = self.conn.cursor()
+            self._prepared[id(cursor)] = OrderedDict()
+            self._cursors.put_nowait(cursor)
+
+    @asynccontextmanager
+    async def connection(self):
+        # Waits (without blocking the loop) until a cursor is free
+        cursor = await self._cursors.get()
+        try:
+            yield cursor
+        finally:
+            self._cursors.put_nowait(cursor)
+
+    def execute(self, cursor, sql, params=()):
+        """
+        Execute sql on a pooled cursor through a prepared statement, so the
+        statement is parsed and planned once per cursor rather than per request.
+
+        DuckDB can't bind client-side parameters into an EXECUTE, so params are
+        rendered as integer literals; only integer parameters are supported.
+
+        The SQL varies with the client's ?fields= projection, so each cursor keeps
+        at most DUCKDB_MAX_PREPARED statements and deallocates the least recently used.
+        """
+        name = "stmt_" + hashlib.sha1(sql.encode("utf-8")).hexdigest()[:16]
+        prepared = self._prepared[id(cursor)]
+        if name in prepared:
+            prepared.move_to_end(name)
+        else:
+            if len(prepared) >= DUCKDB_MAX_PREPARED:
+                oldest, _ = prepared.popitem(last=False)
+                cursor.execute(f"DEALLOCATE {oldest}")
+            cursor.execute(f"PREPARE {name} AS {sql}")
+            prepared[name] = None
+        if not params:
+            return cursor.execute(f"EXECUTE {name}")
+        args = ", ".join(str(int(param)) for param in params)
+        return cursor.execute(f"EXECUTE {name}({args})")
+
+    async def run(self, fn, *args):
+        """Run a blocking DuckDB call on the pool's executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, fn, *args)
+
+    def prewarm(self, table, limit=None):
+        """
+        Load a table's blocks into the buffer pool so the first requests don't pay cold I/O.
+
+        Only LOADs cache_prewarm: installing it would download the extension at
+        startup, so it has to be provisioned with the database instead.
+        """
+        try:
+            self.conn.execute("LOAD cache_prewarm")
+            if limit:
+                self.conn.execute("SELECT prewarm(?, 'buffer', ?)", [table, limit])
+            else:
+                self.conn.execute("SELECT prewarm(?, 'buffer')", [table])
+            logger.info(f"Prewarmed DuckDB table '{table}'")
+        except Exception as e:
+            # Prewarming is an optimization only; serve cold rather than fail startup
+            logger.warning(f"Could not prewarm DuckDB table '{table}': {str(e)}")
+
+    def columns(self, table):
+        """Return the column names of a table, in table order."""
+        rows = self.conn.execute(
+            "SELECT column_name FROM information_schema.columns WHERE table_name = ? ORDER BY ordinal_position",
+            [table]
+        ).fetchall()
+        return tuple(row[0] for row in rows)
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        while not self._cursors.empty():
+            self._cursors.get_nowait().close()
+        self.conn.close()
+
+
+class ResponseCache:
+    """
+    In-process TTL cache of serialized response bodies, keyed by route and query.
+
+    max_bytes bounds the total size of all cached bodies. Least recently used
+    entries are evicted to make room, and expired entries are dropped when
+    they're looked up or when a new entry is stored.
+    """
+
+    def __init__(self, ttl, max_bytes):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _remove(self, key):
+        _, _, body = self._entries.pop(key)
+        self._size -= len(body)
+
+    def get(self, key):
+        """Return (etag, body) for a fresh entry, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+        return entry[1], entry[2]
+
+    def put(self, key, body, version=""):
+        etag = f'"{version}-{hashlib.sha1(body).hexdigest()}"'
+        if len(body) > self.max_bytes:
+            return etag
+        now = time.monotonic()
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            expired = [k for k, entry in self._entries.items() if entry[0] < now]
+            for k in expired:
+                self._remove(k)
+            while self._entries and self._size + len(body) > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+            self._entries[key] = (now + self.ttl, etag, body)
+            self._size += len(body)
+        return etag
+
+    async def record(self, key, chunks, version=""):
+        """
+        Pass chunks through while keeping a copy, and cache the full body once the
+        stream completes. Bodies larger than max_bytes are streamed but not cached.
+        """
+        parts = []
+        size = 0
+        async for chunk in chunks:
+            if parts is not None:
+                size += len(chunk)
+                if size > self.max_bytes:
+                    parts = None
+                else:
+                    parts.append(chunk)
+            yield chunk
+        if parts is not None:
+            self.put(key, b"".join(parts), version)
+
+
+class TableVersion:
+    """
+    Cheap change token for a table, re-read at most once every interval seconds.
+
+    The token is the table's max(rowid) and row count, so appends, deletes and
+    reloads all change it; cached responses are keyed on it.
+    """
+
+    def __init__(self, table, interval):
+        self.sql = f"SELECT max(rowid), count(*) FROM {table}"
+        self.interval = interval
+        self._token = None
+        self._checked_at = float("-inf")
+        self._lock = asyncio.Lock()
+
+    async def current(self, pool):
+        if time.monotonic() - self._checked_at < self.interval:
+            return self._token
+        async with self._lock:
+            # Another request may have refreshed it while we waited
+            if time.monotonic() - self._checked_at >= self.interval:
+                async with pool.connection() as conn:
+                    max_rowid, row_count = await pool.run(lambda: pool.execute(conn, self.sql).fetchone())
+                self._token = f"{max_rowid}.{row_count}"
+                self._checked_at = time.monotonic()
+        return self._token
+
+
+async def cached_response(request, key, produce, media_type):
+    """
+    Serve a cached body (or 304 when the client's ETag still matches), otherwise
+    stream a fresh body from produce() and cache it on the way out.
+
+    Keys and ETags include the grants table's version token, so a change to the
+    table invalidates cached bodies within RESPONSE_CACHE_VERSION_INTERVAL
+    seconds rather than only when the TTL runs out.
+
+    A streamed response has no ETag, since its headers are sent before the body
+    is known. Clients get one from the first request served from the cache.
+    """
+    cache = request.app.state.response_cache
+    version = await request.app.state.grants_version.current(request.app.state.duckdb)
+    key = (version,) + key
+    headers = {"Cache-Control": f"max-age={int(cache.ttl)}"}
+    hit = cache.get(key)
+    if hit is not None:
+        etag, body = hit
+        headers["ETag"] = etag
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type=media_type, headers=headers)
+    body = produce()
+    if cache.ttl > 0:
+        body = cache.record(key, body, version)
+    return StreamingResponse(body, media_type=media_type, headers=headers)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    app.state.duckdb = ConnectionPool(DUCKDB_PATH, DUCKDB_POOL_SIZE, config={
+        "threads": DUCKDB_THREADS,  # Worker threads per query
+        "memory_limit": DUCKDB_MEMORY_LIMIT,  # Cap buffer pool so load spikes can't OOM the worker
+        "enable_object_cache": True  # Keep parquet/object metadata cached across queries
+    })
+    app.state.response_cache = ResponseCache(RESPONSE_CACHE_TTL, RESPONSE_CACHE_MAX_BYTES)
+    app.state.grants_version = TableVersion("grants", RESPONSE_CACHE_VERSION_INTERVAL)
+    # Whitelist for ?fields= projections; user input is never interpolated into SQL
+    app.state.grants_columns = app.state.duckdb.columns("grants")
+    if DUCKDB_PREWARM:
+        app.state.duckdb.prewarm("grants", DUCKDB_PREWARM_LIMIT)
+    yield
+    app.state.duckdb.close()
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+
+def _json_default(value):
+    # orjson doesn't encode Decimal; keep DECIMAL columns as JSON numbers, the
+    # way FastAPI's encoder did (int when integral, float otherwise)
+    if isinstance(value, Decimal):
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    return str(value)
+
+
+def _next_json_chunk(cursor, keyed):
+    batch = cursor.fetchmany(STREAM_BATCH_SIZE)
+    if not batch:
+        return None, 0, None
+    last_key = None
+    if keyed:
+        # First column is the keyset key; it is reported as next_cursor, not returned per row
+        last_key = batch[-1][0]
+        batch = [row[1:] for row in batch]
+    # Strip the enclosing brackets so batches concatenate into one array
+    return orjson.dumps(batch, default=_json_default)[1:-1], len(batch), last_key
+
+
+async def stream_rows(pool, sql, params=(), page_size=None):
+    """
+    Yield a {"grants": [...]} JSON document batch by batch.
+
+    Only one batch of rows is held in memory at a time, so response memory
+    stays constant no matter how large the table grows.
+
+    When page_size is given the query must select the keyset key as its first
+    column, and the document gains a "next_cursor" (null on the last page).
+    """
+    keyed = page_size is not None
+    async with pool.connection() as conn:
+        cursor = await pool.run(pool.execute, conn, sql, params)
+        yield b'{"grants":['
+        first = True
+        row_count = 0
+        last_key = None
+        while True:
+            chunk, count, key = await pool.run(_next_json_chunk, cursor, keyed)
+            if chunk is None:
+                break
+            row_count += count
+            last_key = key
+            yield chunk if first else b"," + chunk
+            first = False
+        if keyed:
+            next_cursor = last_key if row_count == page_size else None
+            yield b'],"next_cursor":' + orjson.dumps(next_cursor) + b'}'
+        else:
+            yield b']}'
+
+
+def _drain(sink):
+    data = sink.getvalue()
+    sink.seek(0)
+    sink.truncate()
+    return data
+
+
+def _next_arrow_chunk(reader, writer, sink):
+    batch = next(reader, None)
+    if batch is None:
+        return None
+    writer.write_batch(batch)
+    return _drain(sink)
+
+
+async def stream_arrow(pool, sql, params=()):
+    """
+    Yield the query result as an Arrow IPC stream, one record batch at a time.
+
+    Columns go straight from DuckDB's vectors into Arrow buffers without
+    being boxed into Python objects along the way.
+    """
+    async with pool.connection() as conn:
+        cursor = await pool.run(pool.execute, conn, sql, params)
+        reader = await pool.run(cursor.fetch_record_batch, STREAM_BATCH_SIZE)
+        sink = io.BytesIO()
+        with pa.ipc.new_stream(sink, reader.schema) as writer:
+            while True:
+                chunk = await pool.run(_next_arrow_chunk, reader, writer, sink)
+                if chunk is None:
+                    break
+                yield chunk
+        # End-of-stream marker written when the writer closes
+        yield _drain(sink)
+
+
+def grants_projection(fields):
+    """
+    Build the SELECT list for the grants table, restricted to the requested columns.
+
+    Args:
+        fields (str): Comma-separated column names, or None for all columns
+
+    Returns:
+        str: Projection to use after SELECT
+    """
+    if not fields:
+        return "*"
+
+    allowed = app.state.grants_columns
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in allowed]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+
+    return ", ".join(f'"{field}"' for field in requested)
 
-app = FastAPI()
 
 @app.get("/grants")
-def get_grants():
-    conn = duckdb.connect("openjordi.duckdb")
-    results = conn.execute("SELECT * FROM grants").fetchall()
-    return {"grants": results}
+async def get_grants(
+    request: Request,
+    fields: Optional[str] = None,
+    limit: int = Query(GRANTS_PAGE_SIZE, ge=1, le=GRANTS_MAX_PAGE_SIZE),
+    after: int = -1
+):
+    # Keyset pagination on DuckDB's rowid: grants has no guaranteed id column,
+    # and unlike OFFSET a seek on rowid doesn't rescan the skipped rows
+    sql = f"SELECT rowid, {grants_projection(fields)} FROM grants WHERE rowid > ? ORDER BY rowid LIMIT ?"
+    params = (after, limit)
+    return await cached_response(
+        request, ("grants", sql, params),
+        lambda: stream_rows(app.state.duckdb, sql, params, page_size=limit),
+        "application/json"
+    )
+
+
+@app.get("/grants.arrow")
+async def get_grants_arrow(request: Request, fields: Optional[str] = None):
+    sql = f"SELECT {grants_projection(fields)} FROM grants"
+    return await cached_response(
+        request, ("grants.arrow", sql),
+        lambda: stream_arrow(app.state.duckdb, sql),
+        "application/vnd.apache.arrow.stream"
+    )
+
 
 if __name__ == "__main__":
     import uvicorn
@@ -2,6 +2,11 @@
 # Add this to your config.py file
 import os
 
+# Environment lookups are resolved once at import and reused everywhere below
+LLM_API_KEY = os.getenv("OPENAI_API_KEY")
+LLM_API_URL = os.getenv("LLM_API_URL", "https://api.openai.com/v1/chat/completions")
+LLM_MODEL = os.getenv("LLM_MODEL", "gpt-4o-mini")
+
 # LLM Parser Configuration
 LLM_PARSER_CONFIG = {
     "html": {
@@ -56,9 +61,9 @@ PARSER_CONFIGS = {
         "use_llm": True,
         "llm_config": LLM_PARSER_CONFIG["html"]["llm_config"],
         "prompt_template": LLM_PARSER_CONFIG["html"]["prompt_template"],
-        "LLM_API_KEY": os.getenv("OPENAI_API_KEY"),  # Set via environment variable  
-        "LLM_API_URL": os.getenv("LLM_API_URL", "https://api.openai.com/v1/chat/completions"),
-        "LLM_MODEL": os.getenv("LLM_MODEL", "gpt-4o-mini"),  # Default to gpt-4
+        "LLM_API_KEY": LLM_API_KEY,  # Set via environment variable  
+        "LLM_API_URL": LLM_API_URL,
+        "LLM_MODEL": LLM_MODEL,  # Default to gpt-4o-mini
     }
 }
 
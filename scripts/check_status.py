@@ -10,29 +10,116 @@ were last updated, and which sources need to be downloaded.
 import os
 import sys
 import json
+import orjson
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-import pandas as pd
-from tabulate import tabulate
 
 # Add project root to path to ensure imports work correctly
 project_root = Path(__file__).resolve().parent.parent
 sys.path.append(str(project_root))
 
-# Import configuration
-from config import DATA_SOURCES, RAW_DATA_DIR
+# Configuration and tabulate are imported where they're used, so
+# `--help` and `--json` runs don't pay for loading them
 
+# Per-source cache of download directory counts, owned by this script
+STATUS_CACHE_FILE = ".status_cache.json"
 
-def check_source_status(source_id):
+
+def directory_stats(path):
+    """
+    Count the files under a directory and sum their sizes.
+    
+    Uses os.scandir so each file is stat'd exactly once (os.walk followed by
+    os.path.getsize stats every file twice).
+    
+    Args:
+        path (str): Directory to scan
+        
+    Returns:
+        tuple: (file_count, total_size_bytes)
+    """
+    file_count = 0
+    total_size = 0
+    # Explicit stack instead of recursion: no per-directory call frame or
+    # (count, size) tuple, and no recursion limit on deeply nested dumps
+    pending = [path]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Like os.walk, don't descend into symlinked directories
+                    if not entry.is_symlink():
+                        pending.append(entry.path)
+                else:
+                    file_count += 1
+                    total_size += entry.stat().st_size
+    return file_count, total_size
+
+
+def indexed_directory_stats(path, cache_file):
+    """
+    Return (file_count, total_size_bytes) for a download directory, reusing the
+    counts cached in the checker's own sidecar file while the directory is unchanged.
+    
+    The cache records the directory's mtime when it was last walked, so the
+    steady-state cost is a single stat. When it differs (or there is no cache
+    for this directory yet) the directory is walked again and the cache rewritten.
+    The fetcher's last_download.json is never written here.
+    
+    Only the top directory's mtime is compared, which changes when entries are
+    added, removed or renamed directly inside it. Files rewritten in place, or
+    changes inside nested subdirectories, are not noticed; downloads go to a
+    new timestamped directory each time, so in practice these don't change
+    after the fetch completes.
+    
+    Args:
+        path (str): The download directory
+        cache_file (str): Path of the sidecar cache (STATUS_CACHE_FILE in the source directory)
+        
+    Returns:
+        tuple: (file_count, total_size_bytes)
+    """
+    mtime = os.stat(path).st_mtime
+    directory = os.path.basename(path)
+    try:
+        cached = orjson.loads(Path(cache_file).read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        cached = {}
+    if cached.get("directory") == directory and cached.get("indexed_at") == mtime:
+        return cached["file_count"], cached["size_bytes"]
+    
+    file_count, total_size = directory_stats(path)
+    
+    updated = {"directory": directory, "indexed_at": mtime, "file_count": file_count, "size_bytes": total_size}
+    try:
+        # Write to a temporary file and rename so readers never see a partial file
+        tmp_file = f"{cache_file}.tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(orjson.dumps(updated, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"Could not update cached directory stats in {cache_file}: {str(e)}")
+    
+    return file_count, total_size
+
+
+def check_source_status(source_id, existing_dirs=None, now=None):
     """
     Check the download status of a specific source.
     
     Args:
         source_id (str): The source ID to check
+        existing_dirs (set, optional): Names of the directories present in RAW_DATA_DIR.
+            When given, sources without a directory are skipped without touching the disk.
+        now (datetime, optional): Reference time for the download age (defaults to now)
         
     Returns:
         dict: Status information for the source
     """
+    from config import DATA_SOURCES, RAW_DATA_DIR
+    
     source_config = DATA_SOURCES.get(source_id, {})
     source_dir = os.path.join(RAW_DATA_DIR, source_id)
     last_download_file = os.path.join(source_dir, "last_download.json")
@@ -49,44 +136,48 @@ def check_source_status(source_id):
         "size_mb": 0
     }
     
-    # Check if the source directory exists
-    if not os.path.exists(source_dir):
+    if existing_dirs is not None and source_id not in existing_dirs:
         return status
     
-    # Check if the last_download.json file exists
-    if os.path.exists(last_download_file):
-        try:
-            with open(last_download_file, "r", encoding="utf-8") as f:
-                last_download = json.load(f)
+    # A missing source directory or last_download.json both surface here,
+    # so there's no need to stat either path beforehand
+    try:
+        last_download = orjson.loads(Path(last_download_file).read_bytes())
+    except FileNotFoundError:
+        return status
+    except Exception as e:
+        print(f"Error reading last download info for {source_id}: {str(e)}")
+        return status
+    
+    try:
+        # Get download timestamp
+        download_time = datetime.fromisoformat(last_download.get("timestamp", ""))
+        current_time = now or datetime.now()
+        age_days = (current_time - download_time).total_seconds() / (60 * 60 * 24)
+        
+        status["downloaded"] = True
+        status["last_download"] = download_time.strftime("%Y-%m-%d %H:%M:%S")
+        status["age_days"] = round(age_days, 1)
+        
+        # Get the download directory
+        download_dir = last_download.get("directory")
+        if download_dir:
+            full_download_path = os.path.join(source_dir, download_dir)
+            status["download_path"] = full_download_path
             
-            # Get download timestamp
-            download_time = datetime.fromisoformat(last_download.get("timestamp", ""))
-            current_time = datetime.now()
-            age_days = (current_time - download_time).total_seconds() / (60 * 60 * 24)
+            # Count files and calculate total size
+            try:
+                file_count, total_size = indexed_directory_stats(
+                    full_download_path, os.path.join(source_dir, STATUS_CACHE_FILE)
+                )
+            except FileNotFoundError:
+                file_count, total_size = 0, 0
             
-            status["downloaded"] = True
-            status["last_download"] = download_time.strftime("%Y-%m-%d %H:%M:%S")
-            status["age_days"] = round(age_days, 1)
+            status["file_count"] = file_count
+            status["size_mb"] = round(total_size / (1024 * 1024), 2)  # Convert to MB
             
-            # Get the download directory
-            download_dir = last_download.get("directory")
-            if download_dir:
-                full_download_path = os.path.join(source_dir, download_dir)
-                status["download_path"] = full_download_path
-                
-                # Count files and calculate total size
-                if os.path.exists(full_download_path):
-                    file_count = 0
-                    total_size = 0
-                    for root, _, files in os.walk(full_download_path):
-                        file_count += len(files)
-                        total_size += sum(os.path.getsize(os.path.join(root, file)) for file in files)
-                    
-                    status["file_count"] = file_count
-                    status["size_mb"] = round(total_size / (1024 * 1024), 2)  # Convert to MB
-                
-        except Exception as e:
-            print(f"Error reading last download info for {source_id}: {str(e)}")
+    except Exception as e:
+        print(f"Error reading last download info for {source_id}: {str(e)}")
     
     return status
 
@@ -98,11 +189,21 @@ def check_all_sources():
     Returns:
         list: Status information for all sources
     """
-    all_status = []
+    from config import DATA_SOURCES, RAW_DATA_DIR
+    
+    # One directory listing up front instead of an existence check per source
+    try:
+        with os.scandir(RAW_DATA_DIR) as entries:
+            existing_dirs = {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        existing_dirs = set()
     
-    for source_id in DATA_SOURCES:
-        status = check_source_status(source_id)
-        all_status.append(status)
+    now = datetime.now()
+    
+    # Each check only reads its own files, so disk latency can overlap across sources
+    max_workers = max(1, min(32, len(DATA_SOURCES)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        all_status = list(executor.map(partial(check_source_status, existing_dirs=existing_dirs, now=now), DATA_SOURCES))
     
     return all_status
 
@@ -114,25 +215,28 @@ def display_status_table(statuses):
     Args:
         statuses (list): List of status dictionaries
     """
-    # Convert to DataFrame for easier manipulation
-    df = pd.DataFrame(statuses)
+    from tabulate import tabulate
     
     # Sort by downloaded status (not downloaded first), then by age (oldest first)
-    df = df.sort_values(by=["downloaded", "age_days"], ascending=[True, False])
+    statuses = sorted(statuses, key=lambda s: (s["downloaded"], s["age_days"] is None, -(s["age_days"] or 0)))
     
-    # Select and rename columns for display
-    display_df = df[["source_id", "funder", "format", "downloaded", "last_download", "age_days", "file_count", "size_mb"]]
-    display_df.columns = ["Source ID", "Funder", "Format", "Downloaded", "Last Download", "Age (days)", "Files", "Size (MB)"]
+    # Select columns for display
+    rows = [
+        [s["source_id"], s["funder"], s["format"], s["downloaded"], s["last_download"],
+         s["age_days"], s["file_count"], s["size_mb"]]
+        for s in statuses
+    ]
+    headers = ["Source ID", "Funder", "Format", "Downloaded", "Last Download", "Age (days)", "Files", "Size (MB)"]
     
     # Format the table
-    table = tabulate(display_df, headers="keys", tablefmt="pipe", showindex=False)
+    table = tabulate(rows, headers=headers, tablefmt="pipe")
     print("\n=== OpenJordi Data Source Status ===\n")
     print(table)
     
     # Summary statistics
-    downloaded_count = df["downloaded"].sum()
-    total_size_mb = df["size_mb"].sum()
-    print(f"\nSummary: {downloaded_count}/{len(df)} sources downloaded, total size: {total_size_mb:.2f} MB")
+    downloaded_count = sum(1 for s in statuses if s["downloaded"])
+    total_size_mb = sum(s["size_mb"] for s in statuses)
+    print(f"\nSummary: {downloaded_count}/{len(statuses)} sources downloaded, total size: {total_size_mb:.2f} MB")
 
 
 def main():
@@ -147,11 +251,14 @@ def main():
     
     # Get status for all or specified sources
     if args.sources:
+        from config import DATA_SOURCES
+        
         # Check only specified sources
         statuses = []
+        now = datetime.now()
         for source_id in args.sources:
             if source_id in DATA_SOURCES:
-                status = check_source_status(source_id)
+                status = check_source_status(source_id, now=now)
                 statuses.append(status)
             else:
                 print(f"Warning: Source '{source_id}' not found in configuration")
@@ -13,15 +13,24 @@ Usage:
 
 import os
 import sys
-import json
+import csv
+import orjson
+import math
+import time
+import random
+import asyncio
 import logging
-import pandas as pd
+import ijson
 import hashlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-import openai
 from dotenv import load_dotenv
 
+# pandas, pyarrow and openai are imported where they're used, so `--help`
+# runs and warm runs that map nothing don't pay for loading them
+
 # Add project root to path to ensure imports work correctly
 project_root = Path(__file__).resolve().parent.parent
 sys.path.append(str(project_root))
@@ -32,13 +41,82 @@ from config import (
     LLM_PROVIDER, LLM_API_KEY
 )
 
-LLM_MODEL = "gpt-4"
+LLM_MODEL = "gpt-4o"  # Must support JSON mode (response_format={"type": "json_object"})
+JSON_STREAM_THRESHOLD = 50 * 1024 * 1024  # JSON dumps at least this large are streamed, not loaded
+LLM_MAX_CONCURRENCY = 10  # Maximum LLM requests in flight at once
+LLM_BATCH_SIZE = 5  # Files mapped per LLM request when mapping all sources
+LLM_MAX_TOKENS = 1024  # Maximum completion tokens per mapping request
+LLM_REQUEST_TIMEOUT = 20  # Seconds before a stalled LLM request is abandoned
+LLM_MAX_RETRIES = 3  # Retries for connection errors, 429s and 5xx (handled by the SDK)
+LLM_REQUESTS_PER_MINUTE = 60
+LLM_TOKENS_PER_MINUTE = 150000
 
 # Import schema definition
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ontology')))
 
 from grant_ontology import crossref_metadata
 
+# The ontology is static, so its prompt text and the valid mapping targets are built once
+_SCHEMA_TEXT = "\n".join(
+    f"- {field}: {details['Description']} ({details['Limits']})"
+    for field, details in crossref_metadata.items()
+)
+_SCHEMA_FIELDS = set(crossref_metadata) | {"null"}
+
+# Prompts for a single file and for a batch of files; filled in with str.format
+PROMPT_TEMPLATE = """You are an expert in data schema mapping for academic grant data.
+
+I need to map columns from a dataset about research grants from '{source_name}' to the CrossRef grant metadata schema.
+
+SOURCE COLUMNS (with examples from first row if available):
+{column_text}
+
+TARGET SCHEMA (CrossRef grant metadata):
+{schema_text}
+
+For each source column, map it to the most appropriate CrossRef schema field, or 'null' if there is no appropriate match.
+Consider semantic meaning, not just exact name matches. Be thorough and consider all possible mappings.
+
+Return your response as a valid json object with the following format:
+{{"source_column_name": "crossref_field_name", ...}}
+
+Only include the JSON object in your response, with no additional text.
+"""
+
+BATCH_PROMPT_TEMPLATE = """You are an expert in data schema mapping for academic grant data.
+
+I need to map the columns of several datasets about research grants to the CrossRef grant metadata schema.
+Each dataset is listed in its own "### SOURCE:" section, with examples from its first row if available.
+
+{sections}
+
+TARGET SCHEMA (CrossRef grant metadata):
+{schema_text}
+
+For each source column, map it to the most appropriate CrossRef schema field, or 'null' if there is no appropriate match.
+Consider semantic meaning, not just exact name matches. Be thorough and consider all possible mappings.
+
+Return your response as a valid json object keyed by the SOURCE name of each section, with the following format:
+{{"source_name": {{"source_column_name": "crossref_field_name", ...}}, ...}}
+
+Only include the JSON object in your response, with no additional text.
+"""
+
+
+def _columns_key(columns):
+    """
+    Key a column set for the mapping file names; independent of column order.
+    
+    Args:
+        columns (list): List of column names
+        
+    Returns:
+        str: 32-character hex digest
+    """
+    # \x1f (unit separator) is very unlikely in a column name, unlike the comma used before,
+    # so distinct column sets practically never collide
+    return hashlib.blake2b(b"\x1f".join(sorted(col.encode("utf-8") for col in columns)), digest_size=16).hexdigest()
+
 
 # Configure logging
 logging.basicConfig(
@@ -54,9 +132,68 @@ logger = logging.getLogger("openjordi.map_columns")
 # Ensure output directories exist
 ONTOLOGY_DIR = os.path.join(project_root, "ontology")
 MAPPINGS_DIR = os.path.join(ONTOLOGY_DIR, "mappings")
+COLUMNS_INDEX_FILE = os.path.join(MAPPINGS_DIR, "columns.jsonl")  # One {columns_key: columns} line per column set
 os.makedirs(MAPPINGS_DIR, exist_ok=True)
 
 
+class RateLimiter:
+    """
+    Sliding-window limiter for LLM requests per minute and tokens per minute.
+    
+    Requests wait here until they fit in the provider's quota, instead of being
+    sent, rejected with a 429 and retried after a backoff.
+    """
+    
+    def __init__(self, requests_per_minute, tokens_per_minute, window_seconds=60.0):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.window_seconds = window_seconds
+        self._entries = deque()  # [timestamp, tokens] per request in the window
+        self._tokens = 0
+        self._lock = None
+    
+    def _expire(self, now):
+        while self._entries and self._entries[0][0] <= now - self.window_seconds:
+            _, tokens = self._entries.popleft()
+            self._tokens -= tokens
+    
+    async def acquire(self, estimated_tokens):
+        """
+        Wait until a request of estimated_tokens fits in the window and reserve it.
+        
+        Args:
+            estimated_tokens (int): Expected prompt + completion tokens
+            
+        Returns:
+            list: The reservation, to be passed to record_usage once the real cost is known
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._expire(now)
+                # An empty window always admits, so oversized requests can't wait forever
+                if not self._entries or (
+                    len(self._entries) < self.requests_per_minute and
+                    self._tokens + estimated_tokens <= self.tokens_per_minute
+                ):
+                    entry = [now, estimated_tokens]
+                    self._entries.append(entry)
+                    self._tokens += estimated_tokens
+                    return entry
+                
+                # Sleep until the oldest request leaves the window
+                await asyncio.sleep(self._entries[0][0] + self.window_seconds - now)
+    
+    def record_usage(self, entry, actual_tokens):
+        """Replace a reservation's estimate with the tokens the request actually used."""
+        if entry in self._entries:
+            self._tokens += actual_tokens - entry[1]
+        entry[1] = actual_tokens
+
+
 class ColumnMapper:
     """Class to handle mapping source columns to CrossRef schema."""
     
@@ -74,81 +211,319 @@ class ColumnMapper:
             logger.error("No API key found for LLM. Set OPENAI_API_KEY or SAMBANOVA_API_KEY in environment.")
             raise ValueError("Missing API key for language model")
         
+        import openai
+        
         # Initialize OpenAI client based on provider
         if self.llm_provider.lower() == "sambanova":
-            self.client = openai.OpenAI(
+            self.client = openai.AsyncOpenAI(
                 api_key=self.api_key,
                 base_url="https://api.sambanova.ai/v1",
+                timeout=LLM_REQUEST_TIMEOUT,
+                max_retries=LLM_MAX_RETRIES,
             )
         else:  # Default to OpenAI
-            self.client = openai.OpenAI(api_key=self.api_key)
+            self.client = openai.AsyncOpenAI(
+                api_key=self.api_key,
+                timeout=LLM_REQUEST_TIMEOUT,
+                max_retries=LLM_MAX_RETRIES,
+            )
+        
+        # Created lazily so it binds to the running event loop
+        self._llm_semaphore = None
+        self._rate_limiter = RateLimiter(LLM_REQUESTS_PER_MINUTE, LLM_TOKENS_PER_MINUTE)
+        
+        # Content-addressed cache of LLM answers, shared by all sources
+        self._llm_cache_dir = os.path.join(MAPPINGS_DIR, "_llm_cache")
+        os.makedirs(self._llm_cache_dir, exist_ok=True)
+        
+        # Keys already in COLUMNS_INDEX_FILE, loaded on first save
+        self._indexed_columns = None
     
-    def map_all_sources(self, force_remapping=False):
+    async def map_all_sources(self, force_remapping=False, batch_size=LLM_BATCH_SIZE):
         """
         Map columns for all sources found in RAW_DATA_DIR.
         
+        Files that still need a mapping are collected across all sources and
+        sent to the LLM batch_size at a time; at most LLM_MAX_CONCURRENCY LLM
+        requests are in flight at any time.
+        
         Args:
             force_remapping (bool): If True, remap columns even if mapping exists
+            batch_size (int): Number of files to map per LLM request
             
         Returns:
-            dict: Results of mapping operations by source
+            dict: Results of mapping operations by source; a source is only True
+                if every file that needed a mapping got one
         """
-        results = {}
-        
         # Get all source directories in RAW_DATA_DIR
-        for source_name in os.listdir(RAW_DATA_DIR):
-            source_path = os.path.join(RAW_DATA_DIR, source_name)
-            
-            # Skip non-directory items
-            if not os.path.isdir(source_path):
-                continue
-            
-            # Process this source
+        with os.scandir(RAW_DATA_DIR) as entries:
+            source_names = [entry.name for entry in entries if entry.is_dir()]
+        
+        results = {}
+        source_specs = []
+        for source_name in source_names:
             try:
                 logger.info(f"Mapping columns for source: {source_name}")
-                result = self.map_source(source_name, force_remapping)
-                results[source_name] = result
+                pending_files = self.collect_unmapped_files(source_name, force_remapping)
             except Exception as e:
                 logger.error(f"Error mapping columns for source {source_name}: {str(e)}", exc_info=True)
                 results[source_name] = False
+                continue
+            
+            results[source_name] = pending_files is not None
+            source_specs.extend((source_name, *pending_file) for pending_file in pending_files or [])
         
+        # Fold the per-file outcomes back into their source's result
+        file_results = await self.map_sources_batched(source_specs, batch_size)
+        for label, outcome in file_results.items():
+            if not outcome:
+                results[label.split("/", 1)[0]] = False
+        return results
+    
+    async def map_sources_batched(self, source_specs, batch_size=LLM_BATCH_SIZE):
+        """
+        Map and save the columns of many files, packing up to batch_size files
+        into each LLM request.
+        
+        Files with an existing mapping are saved without asking the LLM, and a
+        batch of one, or a file the model left out of a batched answer, goes
+        through the single-file request instead.
+        
+        Args:
+            source_specs (list): (source_name, file_name, columns, first_row, columns_key) tuples
+            batch_size (int): Number of files to map per LLM request
+            
+        Returns:
+            dict: True/False per "source_name/file_name"
+        """
+        results = {}
+        misses = []
+        for spec in source_specs:
+            source_name, csv_file, columns, _, columns_key = spec
+            mapping = self._get_cached_mapping(columns_key, source_name)
+            if mapping is None:
+                misses.append(spec)
+            else:
+                results[f"{source_name}/{csv_file}"] = self._store_mapping(source_name, csv_file, columns, columns_key, mapping)
+        
+        batches = [misses[start:start + batch_size] for start in range(0, len(misses), batch_size)]
+        for batch_results in await asyncio.gather(*[self._map_batch(batch) for batch in batches]):
+            results.update(batch_results)
+        return results
+    
+    async def _map_batch(self, batch):
+        """
+        Map one batch of files with a single LLM request.
+        
+        Args:
+            batch (list): (source_name, file_name, columns, first_row, columns_key) tuples
+            
+        Returns:
+            dict: True/False per "source_name/file_name"
+        """
+        if len(batch) == 1:
+            source_name, csv_file = batch[0][:2]
+            return {f"{source_name}/{csv_file}": await self._map_file(*batch[0])}
+        
+        try:
+            mappings = await self._get_batch_mapping_from_llm(batch)
+        except Exception as e:
+            logger.error(f"Batched LLM mapping failed, mapping files one by one: {str(e)}", exc_info=True)
+            mappings = {}
+        
+        results = {}
+        leftovers = []
+        for spec in batch:
+            source_name, csv_file, columns, _, columns_key = spec
+            label = f"{source_name}/{csv_file}"
+            if label in mappings:
+                results[label] = self._store_mapping(source_name, csv_file, columns, columns_key, mappings[label])
+            else:
+                leftovers.append(spec)
+        
+        if leftovers:
+            outcomes = await asyncio.gather(*[self._map_file(*spec) for spec in leftovers])
+            for (source_name, csv_file, *_), outcome in zip(leftovers, outcomes):
+                results[f"{source_name}/{csv_file}"] = outcome
         return results
     
     def extract_columns_from_file(self, file_path):
         """
-        Extract column names from a CSV file.
+        Extract the column names from a CSV or Parquet file.
+        
+        Only the header line of a CSV (or the footer of a Parquet file) is read;
+        no data rows are parsed.
         
         Args:
-            file_path (str): Path to the CSV file
+            file_path (str): Path to the CSV or Parquet file
             
         Returns:
             list: List of column names
         """
         try:
-            # Try multiple approaches to handle problematic CSVs
+            if file_path.lower().endswith('.parquet'):
+                import pyarrow.parquet as pq
+                return pq.read_schema(file_path).names
+            
             try:
-                df = pd.read_csv(file_path, skip_blank_lines=True)
-            except Exception as e:
-                logger.warning(f"Standard CSV reading failed: {str(e)}")
-                # Try with error handling options
-                try:
-                    if pd.__version__ >= '1.3.0':
-                        df = pd.read_csv(file_path, on_bad_lines='skip',skip_blank_lines=True)
-                    else:
-                        df = pd.read_csv(file_path, error_bad_lines=False,skip_blank_lines=True)
-                except Exception:
-                    # Last resort: try with different encoding
-                    df = pd.read_csv(file_path, encoding='latin1', 
-                                   on_bad_lines='skip' if pd.__version__ >= '1.3.0' else None)
-            
-            # Return column names
-            return df
+                with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+                    return next(csv.reader(f), [])
+            except UnicodeDecodeError:
+                # Same fallback encoding as extract_first_row
+                with open(file_path, 'r', encoding='latin1', newline='') as f:
+                    return next(csv.reader(f), [])
         
         except Exception as e:
             logger.error(f"Error extracting columns from {file_path}: {str(e)}", exc_info=True)
             return []
     
-    def map_source(self, source_name, force_remapping=False):
+    def extract_first_row(self, file_path):
+        """
+        Extract the first data row of a CSV or Parquet file, for LLM examples.
+        
+        Only the first block of a CSV (or the first row group of a Parquet
+        file) is read, so the cost doesn't grow with the size of the dump.
+        
+        Args:
+            file_path (str): Path to the CSV or Parquet file
+            
+        Returns:
+            dict: First-row values by column (empty if there are no rows)
+        """
+        import pyarrow.csv as pv
+        import pyarrow.parquet as pq
+        
+        try:
+            if file_path.lower().endswith('.parquet'):
+                first_batch = next(pq.ParquetFile(file_path).iter_batches(batch_size=1), None)
+                first_rows = first_batch.to_pylist() if first_batch is not None else []
+            else:
+                try:
+                    reader = pv.open_csv(file_path)
+                    try:
+                        first_rows = reader.read_next_batch().slice(0, 1).to_pylist()
+                    except StopIteration:  # Header only
+                        first_rows = []
+                except Exception as e:
+                    logger.warning(f"Arrow CSV reading failed: {str(e)}")
+                    # Fall back to pandas, which copes with non-UTF-8 files
+                    import pandas as pd
+                    df = pd.read_csv(file_path, nrows=1, encoding='latin1')
+                    first_rows = df.to_dict(orient='records')
+            
+            return first_rows[0] if first_rows else {}
+        
+        except Exception as e:
+            logger.error(f"Error reading first row from {file_path}: {str(e)}", exc_info=True)
+            return {}
+    
+    def _write_parquet(self, df, pq_path):
+        """
+        Write a converted Excel/JSON table as a Parquet file next to the original.
+        
+        Args:
+            df (pandas.DataFrame): The converted table
+            pq_path (str): Destination path
+        """
+        import pyarrow as pa
+        
+        try:
+            df.to_parquet(pq_path, index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # Columns mixing types (common in JSON dumps) can't be stored as one Arrow type
+            mixed = df.select_dtypes(include="object").columns
+            df = df.astype({col: "string" for col in mixed})
+            df.to_parquet(pq_path, index=False)
+    
+    def _json_records_prefix(self, json_path):
+        """
+        Find the ijson prefix of the records in a JSON dump without loading it.
+        
+        Mirrors the in-memory conversion: a top-level list holds the records,
+        otherwise the first non-empty list value of a top-level object does.
+        
+        Args:
+            json_path (str): Path to the JSON file
+            
+        Returns:
+            str or None: The prefix to pass to ijson.items, or None if the file
+                has no list of records
+        """
+        with open(json_path, 'rb') as f:
+            events = ijson.parse(f)
+            for prefix, event, _ in events:
+                if event != 'start_array':
+                    continue
+                if prefix == '':
+                    return 'item'
+                # Nested values have dotted prefixes; only top-level lists hold records.
+                # The next event tells whether the list is empty
+                if '.' not in prefix and next(events)[1] != 'end_array':
+                    return f"{prefix}.item"
+        return None
+    
+    def _stream_json_to_parquet(self, json_path, pq_path, chunk_size=10000):
+        """
+        Convert the records of a large JSON dump to Parquet with bounded memory.
+        
+        A first pass collects the union of the record keys, a second writes the
+        records chunk_size at a time. Values are stored as strings, since the
+        types of a column can't be known until the whole file has been read.
+        
+        Args:
+            json_path (str): Path to the JSON file
+            pq_path (str): Destination path
+            chunk_size (int): Records held in memory at a time
+            
+        Returns:
+            bool: True if the file was converted, False if it has no list of records
+        """
+        prefix = self._json_records_prefix(json_path)
+        if prefix is None:
+            return False
+        
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        def records(f):
+            for record in ijson.items(f, prefix, use_float=True):
+                yield record if isinstance(record, dict) else {"0": record}
+        
+        columns = {}  # Ordered set of keys, in order of first appearance
+        with open(json_path, 'rb') as f:
+            for record in records(f):
+                columns.update(dict.fromkeys(record))
+        
+        def to_text(value):
+            if value is None or isinstance(value, str):
+                return value
+            if isinstance(value, (dict, list)):
+                return orjson.dumps(value, default=str).decode("utf-8")
+            return str(value)
+        
+        schema = pa.schema([(str(col), pa.string()) for col in columns])
+        with open(json_path, 'rb') as f, pq.ParquetWriter(pq_path, schema) as writer:
+            chunk = []
+            for record in records(f):
+                chunk.append(record)
+                if len(chunk) == chunk_size:
+                    writer.write_table(self._records_table(chunk, columns, schema, to_text))
+                    chunk = []
+            if chunk:
+                writer.write_table(self._records_table(chunk, columns, schema, to_text))
+        
+        return True
+    
+    def _records_table(self, records, columns, schema, to_text):
+        """Build an all-string Arrow table from a chunk of JSON records."""
+        import pyarrow as pa
+        
+        return pa.table(
+            [[to_text(record.get(col)) for record in records] for col in columns],
+            schema=schema
+        )
+    
+    async def map_source(self, source_name, force_remapping=False):
         """
         Map columns for a specific source.
         
@@ -159,71 +534,108 @@ class ColumnMapper:
         Returns:
             bool: True if successful, False otherwise
         """
+        pending_files = self.collect_unmapped_files(source_name, force_remapping)
+        if pending_files is None:
+            return False
+        
+        success = True
+        for pending_file in pending_files:
+            if not await self._map_file(source_name, *pending_file):
+                success = False
+        
+        return success
+    
+    def collect_unmapped_files(self, source_name, force_remapping=False):
+        """
+        Find the latest download of a source and read the files that need a mapping.
+        
+        Args:
+            source_name (str): Name of the source to map
+            force_remapping (bool): If True, include files that already have a mapping
+            
+        Returns:
+            list or None: (file_name, columns, first_row, columns_key) tuples, or None if the source has no usable files
+        """
         source_path = os.path.join(RAW_DATA_DIR, source_name)
         
-        if not os.path.exists(source_path) or not os.path.isdir(source_path):
+        # One listing of the source directory finds both 'latest' and the download folders
+        try:
+            with os.scandir(source_path) as entries:
+                download_dirs = [entry.name for entry in entries if entry.is_dir() and not entry.name.startswith(".")]
+        except (FileNotFoundError, NotADirectoryError):
             logger.error(f"Source directory not found: {source_path}")
-            return False
+            return None
         
         # Look for the 'latest' directory which should contain the most recent download
-        latest_dir = os.path.join(source_path, "latest")
-        if not os.path.exists(latest_dir) or not os.path.isdir(latest_dir):
+        if "latest" in download_dirs:
+            latest_dir = os.path.join(source_path, "latest")
+        else:
             # If 'latest' doesn't exist, find the most recent download folder
-            download_dirs = [d for d in os.listdir(source_path) 
-                           if os.path.isdir(os.path.join(source_path, d)) and 
-                           d != "latest" and
-                           not d.startswith(".")]
-            
             if not download_dirs:
                 logger.warning(f"No download directories found for source {source_name}, skipping")
-                return False
+                return None
             
-            # Sort by name (which should be timestamp-based)
-            download_dirs.sort(reverse=True)
-            latest_dir = os.path.join(source_path, download_dirs[0])
+            # Names are timestamp-based, so the greatest is the most recent
+            latest_dir = os.path.join(source_path, max(download_dirs))
         
         logger.info(f"Processing latest directory: {latest_dir}")
         
-        # Look for CSV files in the latest directory
-        csv_files = [f for f in os.listdir(latest_dir) if f.lower().endswith('.csv')]
+        # Bucket the files of the latest directory by type in a single listing.
+        # CSV files include Parquet files converted on an earlier run
+        csv_files, excel_files, json_files = [], [], []
+        with os.scandir(latest_dir) as entries:
+            for entry in entries:
+                name = entry.name.lower()
+                if name.endswith(('.csv', '.parquet')):
+                    csv_files.append(entry.name)
+                elif name.endswith(('.xlsx', '.xls')):
+                    excel_files.append(entry.name)
+                elif name.endswith('.json') and entry.name != "metadata.json":
+                    json_files.append(entry.name)
         
         if not csv_files:
             logger.warning(f"No CSV files found in {latest_dir}, looking for other file types")
+            import pandas as pd
             
             # Look for Excel files
-            excel_files = [f for f in os.listdir(latest_dir) if f.lower().endswith(('.xlsx', '.xls'))]
             if excel_files:
                 logger.info(f"Found Excel files: {excel_files}")
                 for excel_file in excel_files:
                     try:
-                        # Convert Excel to CSV for processing
+                        # Convert Excel to Parquet for processing
                         excel_path = os.path.join(latest_dir, excel_file)
-                        csv_path = os.path.join(latest_dir, f"{os.path.splitext(excel_file)[0]}.csv")
+                        pq_path = os.path.join(latest_dir, f"{os.path.splitext(excel_file)[0]}.parquet")
                         
-                        # Convert if CSV doesn't exist or force_remapping is True
-                        if not os.path.exists(csv_path) or force_remapping:
-                            logger.info(f"Converting Excel to CSV: {excel_file}")
+                        # Convert if Parquet doesn't exist or force_remapping is True
+                        if not os.path.exists(pq_path) or force_remapping:
+                            logger.info(f"Converting Excel to Parquet: {excel_file}")
                             df = pd.read_excel(excel_path)
-                            df.to_csv(csv_path, index=False)
-                            csv_files.append(os.path.basename(csv_path))
+                            self._write_parquet(df, pq_path)
+                            csv_files.append(os.path.basename(pq_path))
                     except Exception as e:
-                        logger.error(f"Error converting Excel to CSV: {str(e)}", exc_info=True)
+                        logger.error(f"Error converting Excel to Parquet: {str(e)}", exc_info=True)
             
             # Look for JSON files
-            json_files = [f for f in os.listdir(latest_dir) if f.lower().endswith('.json') and f != "metadata.json"]
             if json_files and not csv_files:
                 logger.info(f"Found JSON files: {json_files}")
                 for json_file in json_files:
                     try:
-                        # Convert JSON to CSV for processing
+                        # Convert JSON to Parquet for processing
                         json_path = os.path.join(latest_dir, json_file)
-                        csv_path = os.path.join(latest_dir, f"{os.path.splitext(json_file)[0]}.csv")
+                        pq_path = os.path.join(latest_dir, f"{os.path.splitext(json_file)[0]}.parquet")
                         
-                        # Convert if CSV doesn't exist or force_remapping is True
-                        if not os.path.exists(csv_path) or force_remapping:
-                            logger.info(f"Converting JSON to CSV: {json_file}")
-                            with open(json_path, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
+                        # Convert if Parquet doesn't exist or force_remapping is True
+                        if not os.path.exists(pq_path) or force_remapping:
+                            logger.info(f"Converting JSON to Parquet: {json_file}")
+                            
+                            # Large dumps are streamed record by record instead of loaded whole
+                            if (os.path.getsize(json_path) >= JSON_STREAM_THRESHOLD and
+                                    self._stream_json_to_parquet(json_path, pq_path)):
+                                csv_files.append(os.path.basename(pq_path))
+                                continue
+                            
+                            with open(json_path, 'rb') as f:
+                                data = orjson.loads(f.read())
                             
                             if isinstance(data, list):
                                 df = pd.DataFrame(data)
@@ -239,92 +651,108 @@ class ColumnMapper:
                                 # Fallback: convert to a single-row DataFrame
                                 df = pd.DataFrame([data])
                             
-                            df.to_csv(csv_path, index=False)
-                            csv_files.append(os.path.basename(csv_path))
+                            self._write_parquet(df, pq_path)
+                            csv_files.append(os.path.basename(pq_path))
                     except Exception as e:
-                        logger.error(f"Error converting JSON to CSV: {str(e)}", exc_info=True)
+                        logger.error(f"Error converting JSON to Parquet: {str(e)}", exc_info=True)
         
         if not csv_files:
             logger.warning(f"No CSV files or convertible files found for {source_name}")
-            return False
+            return None
         
-        # Process each CSV file
-        for csv_file in csv_files:
-            try:
-                csv_path = os.path.join(latest_dir, csv_file)
-                logger.info(f"Processing CSV file: {csv_path}")
-                
-                # Extract columns from the CSV file
-                df = self.extract_columns_from_file(csv_path)
-                
-                if not df.columns.any():
-                    logger.warning(f"No columns found in {csv_file}")
-                    continue
-                
-                logger.info(f"Found {len(df.columns)} columns in {csv_file}")
-                
-                # Check if mapping already exists
-                mapping_exists = self.check_if_mapping_exists(source_name, df.columns)
-                
-                if mapping_exists and not force_remapping:
-                    logger.info(f"Mapping already exists for {source_name}/{csv_file}, skipping")
-                    continue
-                
-                # Get mapping for these columns
-                mapping = self.get_column_mapping(df, source_name)
-                
-                if mapping:
-                    # Save the mapping
-                    self.save_mapping(source_name, df.columns, mapping)
-                    logger.info(f"Successfully mapped {len(mapping)} columns for {source_name}/{csv_file}")
-                else:
-                    logger.warning(f"Failed to get mapping for {source_name}/{csv_file}")
-            except Exception as e:
-                logger.error(f"Error processing {csv_file}: {str(e)}", exc_info=True)
+        def read_file(csv_file):
+            csv_path = os.path.join(latest_dir, csv_file)
+            logger.info(f"Processing CSV file: {csv_path}")
+            
+            # Extract columns from the file header
+            columns = self.extract_columns_from_file(csv_path)
+            if not columns:
+                return columns, None, None
+            
+            # Data rows are only read when the LLM will need an example, i.e. when
+            # there's no mapping for this column set yet
+            columns_key = _columns_key(columns)
+            if self.check_if_mapping_exists(source_name, columns_key) and not force_remapping:
+                return columns, columns_key, None
+            
+            return columns, columns_key, self.extract_first_row(csv_path)
         
-        return True
+        # File reads are I/O bound (and pyarrow releases the GIL), so files are read in parallel
+        pending_files = []
+        with ThreadPoolExecutor(max_workers=min(8, len(csv_files))) as executor:
+            futures = {executor.submit(read_file, csv_file): csv_file for csv_file in csv_files}
+            for future in as_completed(futures):
+                csv_file = futures[future]
+                try:
+                    columns, columns_key, first_row = future.result()
+                    
+                    if not columns:
+                        logger.warning(f"No columns found in {csv_file}")
+                        continue
+                    
+                    logger.info(f"Found {len(columns)} columns in {csv_file}")
+                    
+                    if first_row is None:
+                        logger.info(f"Mapping already exists for {source_name}/{csv_file}, skipping")
+                        continue
+                    
+                    pending_files.append((csv_file, columns, first_row, columns_key))
+                except Exception as e:
+                    logger.error(f"Error processing {csv_file}: {str(e)}", exc_info=True)
+        
+        return pending_files
     
-    def extract_file(self, file_path):
+    async def _map_file(self, source_name, csv_file, columns, first_row, columns_key):
         """
-        Extract column names from a CSV file.
+        Get and save the mapping for one file with a single-file LLM request.
         
         Args:
-            file_path (str): Path to the CSV file
+            source_name (str): Name of the source
+            csv_file (str): Name of the file within the source's download
+            columns (list): The file's column names
+            first_row (dict): The file's first-row values by column
+            columns_key (str): Key of the column set, from _columns_key
             
         Returns:
-            list: List of column names
+            bool: True if a mapping was saved, False otherwise
         """
         try:
-            # Try multiple approaches to handle problematic CSVs
-            try:
-                df = pd.read_csv(file_path, skip_blank_lines=True)
-            except Exception as e:
-                logger.warning(f"Standard CSV reading failed: {str(e)}")
-                # Try with error handling options
-                try:
-                    if pd.__version__ >= '1.3.0':
-                        df = pd.read_csv(file_path, on_bad_lines='skip',skip_blank_lines=True)
-                    else:
-                        df = pd.read_csv(file_path, error_bad_lines=False,skip_blank_lines=True)
-                except Exception:
-                    # Last resort: try with different encoding
-                    df = pd.read_csv(file_path, encoding='latin1', 
-                                   on_bad_lines='skip' if pd.__version__ >= '1.3.0' else None)
-            
-            # Return column names
-            return df
+            # Get mapping for these columns
+            mapping = await self.get_column_mapping(columns, first_row, columns_key, source_name)
+        except Exception as e:
+            logger.error(f"Error processing {csv_file}: {str(e)}", exc_info=True)
+            return False
+        
+        return self._store_mapping(source_name, csv_file, columns, columns_key, mapping)
+    
+    def _store_mapping(self, source_name, csv_file, columns, columns_key, mapping):
+        """
+        Save a file's mapping, or log that none was obtained.
+        
+        Returns:
+            bool: True if a mapping was saved, False otherwise
+        """
+        if not mapping:
+            logger.warning(f"Failed to get mapping for {source_name}/{csv_file}")
+            return False
         
+        try:
+            # Save the mapping
+            self.save_mapping(source_name, columns, columns_key, mapping)
         except Exception as e:
-            logger.error(f"Error extracting columns from {file_path}: {str(e)}", exc_info=True)
-            return []
+            logger.error(f"Error processing {csv_file}: {str(e)}", exc_info=True)
+            return False
+        
+        logger.info(f"Successfully mapped {len(mapping)} columns for {source_name}/{csv_file}")
+        return True
     
-    def check_if_mapping_exists(self, source_name, columns):
+    def check_if_mapping_exists(self, source_name, columns_key):
         """
         Check if a mapping already exists for this source and columns.
         
         Args:
             source_name (str): Name of the source
-            columns (list): List of column names
+            columns_key (str): Key of the column set, from _columns_key
             
         Returns:
             bool: True if mapping exists, False otherwise
@@ -335,38 +763,38 @@ class ColumnMapper:
         if not os.path.exists(source_dir):
             return False
         
-        # Create a hash of the columns to use as a key
-        columns_hash = hashlib.md5(",".join(sorted(columns)).encode()).hexdigest()
-        mapping_file = os.path.join(source_dir, f"{columns_hash}_mapping.json")
+        mapping_file = os.path.join(source_dir, f"{columns_key}_mapping.json")
         
         return os.path.exists(mapping_file)
     
-    def get_column_mapping(self, df, source_name):
+    async def get_column_mapping(self, columns, first_row, columns_key, source_name):
         """
         Get mapping between source columns and CrossRef schema.
         
         Args:
             columns (list): List of column names
+            first_row (dict): First-row values by column, used as examples
+            columns_key (str): Key of the column set, from _columns_key
             source_name (str): Name of the source
             
         Returns:
             dict: Mapping from source columns to schema columns
         """
         # First check if we have a cached mapping
-        mapping = self._get_cached_mapping(df.columns, source_name)
+        mapping = self._get_cached_mapping(columns_key, source_name)
         
         if mapping is None:
             # Get mapping from LLM
-            mapping = self._get_column_mapping_from_llm(df, source_name)
+            mapping = await self._get_column_mapping_from_llm(columns, first_row, source_name)
         
         return mapping
     
-    def _get_cached_mapping(self, columns, source_name):
+    def _get_cached_mapping(self, columns_key, source_name):
         """
         Check if we have a cached mapping for this source and columns.
         
         Args:
-            columns (list): List of column names
+            columns_key (str): Key of the column set, from _columns_key
             source_name (str): Name of the source
             
         Returns:
@@ -378,14 +806,12 @@ class ColumnMapper:
         if not os.path.exists(source_dir):
             return None
         
-        # Create a hash of the columns to use as a key
-        columns_hash = hashlib.md5(",".join(sorted(columns)).encode()).hexdigest()
-        mapping_file = os.path.join(source_dir, f"{columns_hash}_mapping.json")
+        mapping_file = os.path.join(source_dir, f"{columns_key}_mapping.json")
         
         if os.path.exists(mapping_file):
             try:
-                with open(mapping_file, 'r', encoding='utf-8') as f:
-                    cached_data = json.load(f)
+                with open(mapping_file, 'rb') as f:
+                    cached_data = orjson.loads(f.read())
                 logger.info(f"Using cached mapping for {source_name}")
                 return cached_data["mapping"]
             except Exception as e:
@@ -393,193 +819,287 @@ class ColumnMapper:
         
         return None
     
-    def save_mapping(self, source_name, columns, mapping):
+    def save_mapping(self, source_name, columns, columns_key, mapping):
         """
         Save a column mapping to the ontology/mappings directory.
         
         Args:
             source_name (str): Name of the source
             columns (list): List of column names
+            columns_key (str): Key of the column set, from _columns_key
             mapping (dict): The column mapping to save
         """
         # Create source-specific directory
         source_dir = os.path.join(MAPPINGS_DIR, source_name)
         os.makedirs(source_dir, exist_ok=True)
         
-        # Create a hash of the columns to use as a key
-        columns_hash = hashlib.md5(",".join(sorted(columns)).encode()).hexdigest()
-        mapping_file = os.path.join(source_dir, f"{columns_hash}_mapping.json")
+        mapping_file = os.path.join(source_dir, f"{columns_key}_mapping.json")
+        
+        # The column list is stored once per column set in COLUMNS_INDEX_FILE,
+        # so mapping files stay small however wide the source is
+        self._index_columns(columns_key, columns)
         
         # Prepare mapping data
         mapping_data = {
             "source": source_name,
-            "columns": columns,
+            "columns_hash": columns_key,
+            "n_columns": len(columns),
+            "columns_ref": os.path.basename(COLUMNS_INDEX_FILE),
             "timestamp": datetime.now().isoformat(),
             "mapping": mapping
         }
         
         # Save mapping to file
-        with open(mapping_file, 'w', encoding='utf-8') as f:
-            json.dump(mapping_data, f, indent=2, ensure_ascii=False)
+        with open(mapping_file, 'wb') as f:
+            f.write(orjson.dumps(mapping_data, option=orjson.OPT_INDENT_2))
         
         logger.info(f"Saved mapping to {mapping_file}")
     
-    def _get_column_mapping_from_llm(self, df, source_name):
+    def _index_columns(self, columns_key, columns):
+        """
+        Record a column set in COLUMNS_INDEX_FILE unless it is already there.
+        
+        Args:
+            columns_key (str): Key of the column set, from _columns_key
+            columns (list): List of column names
+        """
+        if self._indexed_columns is None:
+            self._indexed_columns = set()
+            try:
+                with open(COLUMNS_INDEX_FILE, 'rb') as f:
+                    for line in f:
+                        if line.strip():
+                            self._indexed_columns.update(orjson.loads(line))
+            except FileNotFoundError:
+                pass
+        
+        if columns_key in self._indexed_columns:
+            return
+        
+        # One write per line, so concurrent appends don't interleave
+        with open(COLUMNS_INDEX_FILE, 'ab') as f:
+            f.write(orjson.dumps({columns_key: columns}) + b"\n")
+        self._indexed_columns.add(columns_key)
+    
+    async def _get_column_mapping_from_llm(self, columns, first_row, source_name):
         """
         Use an LLM to map source columns to CrossRef schema.
         
         Args:
             columns (list): List of column names to map
+            first_row (dict): First-row values by column, used as examples
             source_name (str): The name of the source
             
         Returns:
             dict: Mapping from source columns to schema columns
         """
-
-        columns = df.columns
-        column_examples = {}
-    
-        for col in columns:
-            if col in df.columns:
-                if not df[col].iloc[0] is None and not pd.isna(df[col].iloc[0]):
-                    column_examples[col] = str(df[col].iloc[0])
-                else:
-                    break
-
-        print(df)
-        # Format column information with examples
-        column_info = []
-        for col in columns:
-            if col in column_examples:
-                column_info.append(f"* {col}: {column_examples.get(col)}")
-            else:
-                column_info.append(f"* {col}")
-        
-        column_text = "\n".join(column_info)
-
-
-        # Prepare schema information with descriptions
-        schema_info = []
-        for field, details in crossref_metadata.items():
-            schema_info.append(f"- {field}: {details['Description']} ({details['Limits']})")
-        
-        schema_text = "\n".join(schema_info)
+        column_text = self._format_column_info(columns, first_row)
         
         # Create prompt for LLM
-        prompt = f"""
-        You are an expert in data schema mapping for academic grant data.
+        prompt = PROMPT_TEMPLATE.format(source_name=source_name, column_text=column_text, schema_text=_SCHEMA_TEXT)
         
-        I need to map columns from a dataset about research grants from '{source_name}' to the CrossRef grant metadata schema.
-        
-        SOURCE COLUMNS (with examples from first row if available):
-        {column_text}
+        try:
+            # Identical prompts (same columns, examples and schema) are answered from disk
+            cache_key = hashlib.sha256((self.model + prompt).encode("utf-8")).hexdigest()
+            cached_mapping = self._read_llm_cache(cache_key)
+            if cached_mapping is not None:
+                logger.info(f"Using cached LLM response for {source_name}")
+                return cached_mapping
+            
+            logger.info(f"Requesting column mapping from LLM for {source_name}")
+            mapping = await self._request_json(prompt, LLM_MAX_TOKENS, source_name)
+            
+            valid_mapping = self._filter_mapping(mapping)
+            logger.info(f"Successfully mapped {len(valid_mapping)} columns for {source_name}")
+            self._write_llm_cache(cache_key, valid_mapping)
+            return valid_mapping
+            
+        except Exception as e:
+            logger.error(f"Error getting column mapping from LLM: {str(e)}", exc_info=True)
+            # Fallback: Return an empty mapping to avoid complete failure
+            return {}
+    
+    async def _get_batch_mapping_from_llm(self, source_specs):
+        """
+        Use a single LLM request to map the columns of several files.
         
-        TARGET SCHEMA (CrossRef grant metadata):
-        {schema_text}
+        Args:
+            source_specs (list): (source_name, file_name, columns, first_row, columns_key) tuples
+            
+        Returns:
+            dict: Mapping from "source_name/file_name" to that file's column mapping.
+                Files the model left out are missing from the result.
+        """
+        sections = "\n\n".join(
+            f"### SOURCE: {source_name}/{file_name}\n{self._format_column_info(columns, first_row)}"
+            for source_name, file_name, columns, first_row, _ in source_specs
+        )
         
-        For each source column, map it to the most appropriate CrossRef schema field, or 'null' if there is no appropriate match.
-        Consider semantic meaning, not just exact name matches. Be thorough and consider all possible mappings.
+        # Create prompt for LLM
+        prompt = BATCH_PROMPT_TEMPLATE.format(sections=sections, schema_text=_SCHEMA_TEXT)
         
-        Return your response as a valid json with the following format:
-        {{
-            "source_column_name": "crossref_field_name",
-            ...
-        }}
+        labels = ", ".join(f"{source_name}/{file_name}" for source_name, file_name, *_ in source_specs)
+        cache_key = hashlib.sha256((self.model + prompt).encode("utf-8")).hexdigest()
+        cached_mappings = self._read_llm_cache(cache_key)
+        if cached_mappings is not None:
+            logger.info(f"Using cached LLM response for {labels}")
+            return cached_mappings
         
-        Only include the Python dictionary in your response, with no additional text.
-        """
-
+        logger.info(f"Requesting batched column mapping from LLM for {labels}")
+        response = await self._request_json(prompt, LLM_MAX_TOKENS * len(source_specs), labels)
         
-
-
+        mappings = {
+            label: self._filter_mapping(mapping)
+            for label, mapping in response.items()
+            if isinstance(mapping, dict)
+        }
+        self._write_llm_cache(cache_key, mappings)
+        return mappings
     
+    async def _request_json(self, prompt, max_tokens, label):
+        """
+        Send a prompt to the LLM in JSON mode and return the parsed object.
         
-        try:
-            logger.info(f"Requesting column mapping from LLM for {source_name}")
+        Args:
+            prompt (str): The user prompt
+            max_tokens (int): Completion token budget
+            label (str): What is being mapped, for log messages
             
-            # Make API request with retry
-            for attempt in range(3):
-                try:
-
-                    print(prompt)
-                    response = self.client.chat.completions.create(
-                        model=self.model,
-                        messages=[
-                            {"role": "system", "content": "You are a helpful academic data assistant that maps columns between schemas."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        temperature=0.1,
-                        max_tokens=1500,
-                    )
-                    
-                    # Get the response content
-                    response_text = response.choices[0].message.content.strip()
-
-                    print(response_text)
-                    
-                    # Clean up the response to ensure it's valid Python
-                    response_text = self._clean_llm_response(response_text)
-                    
-                    # Convert to dictionary
-                    mapping = eval(response_text)
-                    
-                    # Validate mapping
-                    if not isinstance(mapping, dict):
-                        raise ValueError("LLM response is not a valid dictionary")
-                    
-                    # Filter out any invalid mappings (where target isn't in schema)
-                    valid_mapping = {}
-                    for source_col, target_col in mapping.items():
-                        if target_col in crossref_metadata or target_col == "null":
-                            valid_mapping[source_col] = target_col
-                        else:
-                            logger.warning(f"Invalid target column '{target_col}' for source column '{source_col}'")
-                    
-                    logger.info(f"Successfully mapped {len(valid_mapping)} columns for {source_name}")
-                    return valid_mapping
+        Returns:
+            dict: The parsed JSON object
+        """
+        # Transport errors, timeouts and 429/5xx responses are retried by the
+        # SDK client itself; this loop only retries unusable model output
+        for attempt in range(3):
+            if self._llm_semaphore is None:
+                self._llm_semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+            async with self._llm_semaphore:
+                # Rough estimate: ~4 characters per prompt token plus the completion budget
+                reservation = await self._rate_limiter.acquire(len(prompt) // 4 + max_tokens)
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": "You are a helpful academic data assistant that maps columns between schemas. Always answer with a single JSON object."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.1,
+                    max_tokens=max_tokens,
+                    response_format={"type": "json_object"},
+                )
+                if response.usage:
+                    self._rate_limiter.record_usage(reservation, response.usage.total_tokens)
+            
+            try:
+                # Get the response content
+                response_text = response.choices[0].message.content.strip()
                 
-                except Exception as e:
-                    logger.warning(f"LLM mapping attempt {attempt+1} failed: {str(e)}")
-                    if attempt < 2:  # If not the last attempt
-                        import time
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                    else:
-                        logger.error(f"All LLM mapping attempts failed for {source_name}")
-                        raise
+                # JSON mode guarantees a JSON object, so no text clean-up is needed;
+                # a JSONDecodeError (e.g. truncated output) is retried below
+                result = orjson.loads(response_text)
+                
+                # Validate mapping
+                if not isinstance(result, dict):
+                    raise ValueError("LLM response is not a valid dictionary")
+                
+                return result
             
-        except Exception as e:
-            logger.error(f"Error getting column mapping from LLM: {str(e)}", exc_info=True)
-            # Fallback: Return an empty mapping to avoid complete failure
-            return {}
+            except Exception as e:
+                logger.warning(f"LLM mapping attempt {attempt+1} failed: {str(e)}")
+                if attempt < 2:  # If not the last attempt
+                    # Exponential backoff with jitter, so retries of concurrent requests
+                    # don't land together; awaiting keeps other sources in flight
+                    await asyncio.sleep(2 ** attempt + random.uniform(0, 0.5))
+                else:
+                    logger.error(f"All LLM mapping attempts failed for {label}")
+                    raise
     
-    def _clean_llm_response(self, response_text):
+    def _filter_mapping(self, mapping):
         """
-        Clean the LLM response to ensure it's a valid Python dictionary.
+        Drop mappings whose target isn't a CrossRef schema field.
         
         Args:
-            response_text (str): The raw response from the LLM
+            mapping (dict): Raw mapping returned by the LLM
             
         Returns:
-            str: Cleaned response text that can be safely evaluated
+            dict: Mapping restricted to valid targets
         """
-        # Remove markdown code blocks if present
-        if response_text.startswith("```json"):
-            response_text = response_text[9:]
-        elif response_text.startswith("```"):
-            response_text = response_text[3:]
+        # JSON null for unmapped columns means the same as "null"
+        mapping = {source_col: "null" if target_col is None else target_col for source_col, target_col in mapping.items()}
+        valid_mapping = {
+            source_col: target_col for source_col, target_col in mapping.items()
+            if isinstance(target_col, str) and target_col in _SCHEMA_FIELDS
+        }
         
-        if response_text.endswith("```"):
-            response_text = response_text[:-3]
+        invalid = {source_col: mapping[source_col] for source_col in mapping.keys() - valid_mapping.keys()}
+        if invalid:
+            logger.warning(f"Invalid target columns dropped (source column -> target): {invalid}")
+        return valid_mapping
+    
+    def _format_column_info(self, columns, first_row):
+        """
+        Format the columns of a file, with first-row examples, for a prompt.
+        
+        Args:
+            columns (list): The file's column names
+            first_row (dict): The file's first-row values by column
+            
+        Returns:
+            str: One "* column: example" line per column
+        """
+        # Every non-null value is an example; an empty cell no longer drops the
+        # examples of all the columns after it
+        column_examples = {
+            col: str(value) for col, value in first_row.items()
+            if value is not None and not (isinstance(value, float) and math.isnan(value))
+        }
+        
+        # Format column information with examples
+        column_info = []
+        for col in columns:
+            if col in column_examples:
+                column_info.append(f"* {col}: {column_examples.get(col)}")
+            else:
+                column_info.append(f"* {col}")
         
-        response_text = response_text.strip()
+        return "\n".join(column_info)
+    
+    def _read_llm_cache(self, cache_key):
+        """
+        Look up a cached LLM mapping by prompt hash.
         
-        # Ensure it starts and ends with curly braces
-        if not response_text.startswith("{"):
-            response_text = "{" + response_text
-        if not response_text.endswith("}"):
-            response_text = response_text + "}"
+        Args:
+            cache_key (str): sha256 of the model name and prompt
+            
+        Returns:
+            dict or None: The cached mapping or None if not found
+        """
+        cache_file = os.path.join(self._llm_cache_dir, f"{cache_key}.json")
+        try:
+            with open(cache_file, 'rb') as f:
+                return orjson.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Error reading cached LLM response: {str(e)}")
+            return None
+    
+    def _write_llm_cache(self, cache_key, mapping):
+        """
+        Store a validated LLM mapping under its prompt hash.
         
-        return response_text
+        Args:
+            cache_key (str): sha256 of the model name and prompt
+            mapping (dict): The validated column mapping
+        """
+        cache_file = os.path.join(self._llm_cache_dir, f"{cache_key}.json")
+        try:
+            # Write to a temporary file and rename so readers never see a partial file
+            tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(mapping))
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.warning(f"Could not cache LLM response: {str(e)}")
 
 
 def main():
@@ -604,7 +1124,7 @@ def main():
         if args.all:
             # Map all sources
             logger.info("Mapping all sources")
-            results = mapper.map_all_sources(force_remapping=args.force)
+            results = asyncio.run(mapper.map_all_sources(force_remapping=args.force))
             
             # Report results
             successful = [source for source, result in results.items() if result is True]
@@ -626,7 +1146,7 @@ def main():
         else:
             # Map specific source
             logger.info(f"Mapping source: {args.source}")
-            result = mapper.map_source(args.source, force_remapping=args.force)
+            result = asyncio.run(mapper.map_source(args.source, force_remapping=args.force))
             
             if result:
                 print(f"Successfully mapped columns for {args.source}")
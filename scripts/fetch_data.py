@@ -19,10 +19,17 @@ download of each source to avoid redundant downloads.
 import os
 import sys
 import logging
-import requests
+import csv
+import asyncio
+import aiohttp
+import itertools
+import contextlib
+import importlib.util
 import pandas as pd
-import json
 import time
+import orjson
+import hashlib
+from collections import ChainMap, deque
 from pathlib import Path
 from datetime import datetime
 from urllib.parse import urlparse
@@ -53,21 +60,174 @@ logging.basicConfig(
 )
 logger = logging.getLogger("openjordi.fetch_data")
 
+# Connection pool: total and per-host open connections, and how long idle
+# keep-alive connections are held for reuse (seconds)
+FETCH_MAX_CONNECTIONS = 64
+FETCH_MAX_CONNECTIONS_PER_HOST = 32
+FETCH_KEEPALIVE_TIMEOUT = 30
+# Transient statuses retried for JSON API requests, with backoff of RETRY_BACKOFF * 2**attempt seconds
+# unless the server sends a Retry-After (honoured up to RETRY_AFTER_MAX seconds)
+RETRY_STATUSES = frozenset([408, 429, 500, 502, 503, 504])
+RETRY_BACKOFF = 0.5
+RETRY_AFTER_MAX = 60
+# Per-source sidecar with the ETag / Last-Modified / content hash of the last download
+CACHE_META_FILE = ".cache_meta.json"
+# Read size for file downloads; large reads keep the per-chunk write/hash overhead low
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+# Files at least this large are fetched as parallel byte ranges when the server
+# supports them, split into this many parts
+RANGED_DOWNLOAD_MIN_SIZE = 64 * 1024 * 1024
+RANGED_DOWNLOAD_PARTS = 8
+# Run-wide record of when each action was last fetched (action_id -> epoch seconds),
+# so skip decisions take one file read instead of a stat + read per action
+FETCH_MANIFEST_FILE = os.path.join(RAW_DATA_DIR, ".fetch_manifest.json")
+# Ask for compressed responses; aiohttp decodes them transparently. Brotli is
+# only advertised when a decoder (brotli or brotlicffi) is installed
+ACCEPT_ENCODING = "gzip, deflate, br" if (
+    importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi")
+) else "gzip, deflate"
+# OpenAIRE result pages requested at once, and the most pages fetched per run
+OPENAIRE_MAX_CONCURRENCY = 8
+OPENAIRE_MAX_PAGES = 1000
+# Preferred OpenAIRE page size (overridable per source with "page_size") and
+# the smallest size the probe falls back to
+OPENAIRE_PAGE_SIZE = 1000
+OPENAIRE_MIN_PAGE_SIZE = 100
+# Polite request rate for the OpenAIRE API, shared by all of its concurrent page requests
+OPENAIRE_REQUESTS_PER_SECOND = 5
+# Rows buffered per Parquet row group when streaming flattened records
+PARQUET_ROW_GROUP_SIZE = 10000
+# Columns of the flattened OpenAIRE table; raw_id is only filled for projects that fail to flatten
+OPENAIRE_CSV_FIELDS = ["code", "acronym", "title", "start_date", "end_date", "funder", "raw_id"]
+# BeautifulSoup parser for scraped pages: the C-based lxml when installed, else the pure-Python one
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+# Model for HTML extraction and the page-text budget sent to it: its 16k-token
+# context minus the 8000 completion tokens and the prompt itself
+LLM_MODEL = "gpt-3.5-turbo-16k"
+LLM_MAX_INPUT_TOKENS = 7800
+# Extraction requests in flight at once across all HTML sources, and how long
+# to wait on a silent connection while the model generates (seconds)
+LLM_MAX_CONCURRENCY = 8
+LLM_TIMEOUT = 180
+LLM_API_URL = "https://api.openai.com/v1/chat/completions"
+# Character fallback for the budget when tiktoken isn't installed (~4 characters per token)
+LLM_MAX_INPUT_CHARS = 32000
+# Extraction prompt for scraped pages, filled in with str.format
+LLM_PROMPT_TEMPLATE = """
+You are an expert at extracting structured data from HTML content.
+The following text is from the website of {source_desc}, which contains information about funded projects or grants.
+
+Please extract all the available project information into a structured JSON array format.
+Each project should include fields like:
+- project_title
+- principal_investigator
+- institution
+- funding_amount (with currency if available)
+- funding_year
+- duration (if available)
+- description
+- research_area
+
+Include any other relevant fields you find. Use null for missing values.
+Return ONLY the JSON array with no additional text or explanation.
+
+Here's the content:
+{text_content}
+"""
+
+
+def _openaire_text(value):
+    """
+    Return the text of an OpenAIRE field.
+    
+    OpenAIRE's JSON wraps most scalars as {"$": text}, but some records carry
+    the bare value instead.
+    
+    Args:
+        value: The field value
+        
+    Returns:
+        str: The field text ("" for a dict without "$")
+    """
+    if isinstance(value, dict):
+        return value.get("$", "")
+    return str(value)
+
+
+def retry_delay(attempt, headers=None, backoff=RETRY_BACKOFF):
+    """
+    Seconds to wait before retrying a request.
+    
+    Args:
+        attempt (int): Zero-based number of the attempt that failed
+        headers (Mapping, optional): Headers of the failed response
+        backoff (float): Base of the exponential backoff
+        
+    Returns:
+        float: The server's Retry-After (in seconds, capped at RETRY_AFTER_MAX)
+            when given, otherwise backoff * 2**attempt
+    """
+    retry_after = (headers or {}).get("Retry-After", "")
+    if retry_after.isdigit():
+        return min(int(retry_after), RETRY_AFTER_MAX)
+    return backoff * 2 ** attempt
+
+
+class RequestRateLimiter:
+    """
+    Token bucket (of one token) that spaces requests at least 1/rate seconds apart.
+    
+    Concurrent callers are queued onto consecutive slots, so a burst of
+    requests is smoothed to the target rate instead of sleeping a fixed pause
+    after each one; a single caller is never delayed beyond the interval.
+    """
+    
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self._next_slot = 0.0
+    
+    async def wait(self):
+        """Wait for this caller's slot."""
+        # No await between reading and advancing the slot, so callers on the
+        # same event loop can't claim the same one
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class OpenAIREPageError(Exception):
+    """An OpenAIRE result page could not be fetched."""
+    
+    def __init__(self, page, cause):
+        super().__init__(f"Error on page {page}: {str(cause)}")
+        self.page = page
+
 
 class DataFetcher:
     """Class to handle data fetching from various sources."""
     
+    # tiktoken encoder for LLM_MODEL, loaded on first use (False if unavailable)
+    _token_encoder = None
+    
     def __init__(self):
         """Initialize the data fetcher."""
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": USER_AGENT
-        })
+        # aiohttp sessions are bound to the event loop they are created in, so
+        # the session is opened by fetch_all_sources and closed when it returns
+        self.session = None
+        self.force_refresh = False
+        self.manifest = {}
+        self.llm_semaphore = None
+        self.openaire_limiter = RequestRateLimiter(OPENAIRE_REQUESTS_PER_SECOND)
     
-    def fetch_all_sources(self, sources_to_fetch=None, force_refresh=False, max_age_days=7):
+    async def fetch_all_sources(self, sources_to_fetch=None, force_refresh=False, max_age_days=7):
         """
         Fetch data from specified sources.
         
+        Sources are fetched concurrently over one pooled aiohttp session; the
+        actions of a single source still run one after another.
+        
         Args:
             sources_to_fetch (dict): Dictionary of sources to fetch (defaults to DATA_SOURCES)
             force_refresh (bool): If True, download all sources regardless of cache status
@@ -82,75 +242,126 @@ class DataFetcher:
         logger.info(f"Starting data fetch for {len(sources_to_fetch)} sources (force_refresh={force_refresh}, max_age_days={max_age_days})")
         
         results = {}
-        skipped = []
+        # Forced runs also bypass the conditional-GET / content-hash cache
+        self.force_refresh = force_refresh
+        self.manifest = self._read_manifest()
         
-        for source_id, source_config in sources_to_fetch.items():
-            try:
-                logger.info(f"Processing source: {source_id}")
+        # Per-read timeouts rather than a total, like requests' timeout, so
+        # large downloads aren't cut off while they are still making progress
+        self.session = aiohttp.ClientSession(
+            headers={"User-Agent": USER_AGENT, "Accept-Encoding": ACCEPT_ENCODING},
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=REQUEST_TIMEOUT, sock_read=REQUEST_TIMEOUT),
+            connector=aiohttp.TCPConnector(
+                limit=FETCH_MAX_CONNECTIONS,
+                limit_per_host=FETCH_MAX_CONNECTIONS_PER_HOST,
+                keepalive_timeout=FETCH_KEEPALIVE_TIMEOUT
+            )
+        )
+        # Created here rather than in __init__ so it belongs to the running loop
+        self.llm_semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+        try:
+            tasks = [
+                self._fetch_source(source_id, source_config, force_refresh, max_age_days)
+                for source_id, source_config in sources_to_fetch.items()
+            ]
+            source_results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            await self.session.close()
+            self.session = None
+            self._write_manifest()
+        
+        for source_id, source_result in zip(sources_to_fetch, source_results):
+            if isinstance(source_result, BaseException):
+                logger.error(f"Error processing source {source_id}: {str(source_result)}", exc_info=source_result)
+                results[source_id] = False
+            else:
+                results.update(source_result)
+        
+        # Summarize results
+        success_count = sum(1 for result in results.values() if result is True)
+        logger.info(f"Data fetch completed. Successfully processed {success_count}/{len(results)} sources.")
+        
+        return results
+    
+    async def _fetch_source(self, source_id, source_config, force_refresh=False, max_age_days=7):
+        """
+        Fetch every action of a single source.
+        
+        Args:
+            source_id (str): The source identifier
+            source_config (dict): The source configuration
+            force_refresh (bool): If True, download regardless of cache status
+            max_age_days (int): Maximum age in days to consider a cached source as valid
+            
+        Returns:
+            dict: Results of fetch operations by action ID
+        """
+        results = {}
+        
+        try:
+            logger.info(f"Processing source: {source_id}")
+            
+            # Get source name for directory structure
+            source_name = source_config.get("source_name", source_id)
+            
+            # Get the action directly from the source config (for individual sources like Marató)
+            single_action = source_config.get("action", "")
+            
+            # Handle multiple actions if applicable (for grouped sources in future)
+            actions = self._get_actions_for_source(source_config)
+            
+            # If we have a single action in the main config, use that
+            if single_action and not actions:
+                actions = [{"action": single_action, "data_link": source_config.get("data_link")}]
+            # If no specific actions, we'll process as a single source
+            elif not actions:
+                actions = [{"action": "", "data_link": source_config.get("data_link")}]
+            
+            data_format = source_config.get("format", "").lower()
+            
+            # Process each action for this source
+            for action_config in actions:
+                action_name = action_config.get("action", "")
+                data_link = action_config.get("data_link")
                 
-                # Get source name for directory structure
-                source_name = source_config.get("source_name", source_id)
+                # Create a unique identifier for this source + action combination
+                action_id = f"{source_id}_{action_name}" if action_name else source_id
                 
-                # Get the action directly from the source config (for individual sources like Marató)
-                single_action = source_config.get("action", "")
+                # Get the path for checking if recently downloaded
+                source_path = self._get_source_path(source_name, action_name)
                 
-                # Handle multiple actions if applicable (for grouped sources in future)
-                actions = self._get_actions_for_source(source_config)
+                # Check if we should skip this source+action (if not force_refresh)
+                if not force_refresh and self._is_fresh(action_id, source_path, max_age_days):
+                    logger.info(f"Skipping {action_id} - already downloaded within the last {max_age_days} days")
+                    results[action_id] = "skipped"
+                    continue
                 
-                # If we have a single action in the main config, use that
-                if single_action and not actions:
-                    actions = [{"action": single_action, "data_link": source_config.get("data_link")}]
-                # If no specific actions, we'll process as a single source
-                elif not actions:
-                    actions = [{"action": "", "data_link": source_config.get("data_link")}]
+                # Overlay the action's data link on the source config without copying it
+                current_config = ChainMap({"data_link": data_link} if data_link else {}, source_config)
                 
-                # Process each action for this source
-                for action_config in actions:
-                    action_name = action_config.get("action", "")
-                    data_link = action_config.get("data_link")
-                    
-                    # Create a unique identifier for this source + action combination
-                    action_id = f"{source_id}_{action_name}" if action_name else source_id
-                    
-                    # Get the path for checking if recently downloaded
-                    source_path = self._get_source_path(source_name, action_name)
-                    
-                    # Check if we should skip this source+action (if not force_refresh)
-                    if not force_refresh and self._is_recently_downloaded(source_path, max_age_days):
-                        logger.info(f"Skipping {action_id} - already downloaded within the last {max_age_days} days")
-                        results[action_id] = "skipped"
-                        skipped.append(action_id)
-                        continue
-                    
-                    # Update source_config with the specific action data link
-                    current_config = source_config.copy()
-                    if data_link:
-                        current_config["data_link"] = data_link
-                    
-                    # Prepare directory for this source+action
-                    source_dir = self._prepare_source_directory(source_name, action_name)
-                    
-                    # Determine the data format and call appropriate fetcher
-                    data_format = source_config.get("format", "").lower()
-                    if data_format in ["csv", "excel", "xlsx"]:
-                        result = self._fetch_file(source_id, current_config, source_dir, action_name)
-                    elif data_format == "api":
-                        result = self._fetch_api(source_id, current_config, source_dir, action_name)
-                    elif data_format == "html":
-                        result = self._fetch_html(source_id, current_config, source_dir, action_name)
-                    else:
-                        logger.warning(f"Unsupported format '{data_format}' for source {source_id}")
-                        result = False
-                    
-                    results[action_id] = result
+                # Prepare directory for this source+action
+                source_dir = await asyncio.to_thread(self._prepare_source_directory, source_name, action_name)
                 
-            except Exception as e:
-                logger.error(f"Error processing source {source_id}: {str(e)}", exc_info=True)
-                results[source_id] = False
-        
-        # Summarize results
-        success_count = sum(1 for result in results.values() if result is True)
-        logger.info(f"Data fetch completed. Successfully processed {success_count}/{len(results)} sources.")
+                # Determine the data format and call appropriate fetcher
+                fetch = FORMAT_DISPATCH.get(data_format)
+                if fetch:
+                    result = await fetch(self, source_id, current_config, source_dir, action_name)
+                else:
+                    logger.warning(f"Unsupported format '{data_format}' for source {source_id}")
+                    result = False
+                
+                # Only a completed fetch becomes 'latest'; unchanged fetches keep
+                # pointing at the previous download
+                if result is True:
+                    await asyncio.to_thread(self._link_latest, source_path, source_dir)
+                if result is True or result == "unchanged":
+                    self.manifest[action_id] = time.time()
+                
+                results[action_id] = result
+            
+        except Exception as e:
+            logger.error(f"Error processing source {source_id}: {str(e)}", exc_info=True)
+            results[source_id] = False
         
         return results
     
@@ -216,163 +427,179 @@ class DataFetcher:
         fetch_dir = os.path.join(source_path, timestamp)
         os.makedirs(fetch_dir, exist_ok=True)
         
-        # Create a symlink or copy to 'latest'
+        return fetch_dir
+    
+    def _link_latest(self, source_path, fetch_dir):
+        """
+        Point the source's 'latest' entry at a completed fetch directory.
+        
+        Args:
+            source_path (str): The source (or source/action) directory
+            fetch_dir (str): The timestamped directory of the completed fetch
+        """
         latest_dir = os.path.join(source_path, "latest")
-        if os.path.exists(latest_dir):
-            if os.path.islink(latest_dir):
-                os.unlink(latest_dir)
-            else:
-                shutil.rmtree(latest_dir)
         
-        # Create symlink where supported, otherwise copy
+        # Build the new link under a temporary name and rename it over 'latest':
+        # the rename is atomic on POSIX, so readers never see 'latest' missing
+        tmp_link = f"{latest_dir}.tmp"
         try:
-            os.symlink(fetch_dir, latest_dir)
-        except (OSError, AttributeError):
-            # Windows may not support symlinks
-            os.makedirs(latest_dir, exist_ok=True)
-            # Copy content later when files are created
+            if os.path.lexists(tmp_link):
+                os.unlink(tmp_link)
+            os.symlink(fetch_dir, tmp_link)
+            os.replace(tmp_link, latest_dir)
+        except (OSError, NotImplementedError):
+            # Windows may not support symlinks (and 'latest' may be a leftover
+            # real directory); record the latest fetch in a pointer file instead
+            if os.path.lexists(tmp_link):
+                os.unlink(tmp_link)
+            with open(os.path.join(source_path, "latest.txt"), "w", encoding="utf-8") as f:
+                f.write(os.path.basename(fetch_dir))
+    
+    def _read_cache_meta(self, source_path, url):
+        """
+        Read the validators stored for the previous download of a URL.
         
-        return fetch_dir
+        Args:
+            source_path (str): The source (or source/action) directory
+            url (str): The URL being fetched
+            
+        Returns:
+            dict: The .cache_meta.json contents, or {} when there is nothing
+                usable (forced run, different URL, or previous download gone)
+        """
+        if self.force_refresh:
+            return {}
+        try:
+            with open(os.path.join(source_path, CACHE_META_FILE), "rb") as f:
+                cache_meta = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+        
+        if cache_meta.get("url") != url or not os.path.isdir(os.path.join(source_path, cache_meta.get("directory", ""))):
+            return {}
+        return cache_meta
     
+    def _write_cache_meta(self, source_path, fetch_dir, url, content_hash, etag=None, last_modified=None):
+        """
+        Record the validators of a completed download in .cache_meta.json.
+        
+        Args:
+            source_path (str): The source (or source/action) directory
+            fetch_dir (str): The timestamped directory holding the download
+            url (str): The URL that was fetched
+            content_hash (str): BLAKE2b digest of the downloaded content
+            etag (str, optional): The response's ETag header
+            last_modified (str, optional): The response's Last-Modified header
+        """
+        cache_meta = {
+            "url": url,
+            "directory": os.path.basename(fetch_dir),
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_hash": content_hash,
+            "fetched_at": datetime.now().isoformat()
+        }
+        try:
+            cache_meta_file = os.path.join(source_path, CACHE_META_FILE)
+            tmp_file = f"{cache_meta_file}.tmp"
+            with open(tmp_file, "wb") as f:
+                f.write(orjson.dumps(cache_meta, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_file, cache_meta_file)
+        except OSError as e:
+            logger.warning(f"Could not write cache metadata for {source_path}: {str(e)}")
     
+    def _discard_unchanged_fetch(self, target_dir, cache_meta, source_id, action_name=None):
         """
-        Special handler for the OpenAIRE API.
+        Drop a fetch directory whose content matches the previous download.
+        
+        The previous download stays 'latest'; last_download.json is refreshed so
+        the source counts as recently downloaded again.
         
         Args:
+            target_dir (str): The timestamped directory of the current fetch
+            cache_meta (dict): The validators of the previous download
             source_id (str): The source identifier
-            source_config (dict): The source configuration
-            target_dir (str): The directory to save the API data
             action_name (str, optional): The name of the action
             
         Returns:
-            bool: True if successful, False otherwise
+            str: "unchanged"
         """
-        try:
-            # Use specific OpenAIRE API endpoint
-            base_url = "http://api.openaire.eu/search/projects"
-            logger.info(f"Fetching OpenAIRE projects data")
-            
-            # Initialize variables
-            all_projects = []
-            page = 1
-            size = 100  # Max size allowed by API
-            total_pages = None
-            
-            # Fetch projects with pagination
-            while True:
-                logger.info(f"Fetching OpenAIRE API page {page}" + 
-                        (f" of {total_pages}" if total_pages else ""))
-                
-                params = {
-                    "format": "json",
-                    "page": page,
-                    "size": size
-                }
-                
-                try:
-                    response = self.session.get(base_url, params=params, timeout=REQUEST_TIMEOUT)
-                    response.raise_for_status()
-                    data = response.json()
-                    
-                    # Get project list
-                    projects = data.get("response", {}).get("results", [])
-                    
-                    # Get pagination info if not already set
-                    if total_pages is None and "response" in data:
-                        total_results = int(data["response"].get("header", {}).get("total", 0))
-                        total_pages = (total_results + size - 1) // size
-                        logger.info(f"Total OpenAIRE projects: {total_results} (approx. {total_pages} pages)")
-                    
-                    if not projects:
-                        logger.info("No more projects. Stopping.")
-                        break
-                    
-                    # Add projects to our collection
-                    all_projects.extend(projects)
-                    logger.info(f"Downloaded {len(projects)} projects from page {page}")
-                    
-                    # Move to next page
-                    page += 1
-                    time.sleep(1)  # Be nice to the API
-                    
-                    # Safety check - if we've processed more pages than expected
-                    if total_pages and page > total_pages + 5:
-                        logger.warning(f"Exceeded expected number of pages ({total_pages}). Stopping.")
-                        break
-                    
-                except Exception as e:
-                    logger.error(f"Error on page {page}: {str(e)}")
-                    break
-            
-            # Save all data
-            base_name = f"{source_id}_{action_name}" if action_name else source_id
-            output_file = os.path.join(target_dir, f"{base_name}.json")
+        shutil.rmtree(target_dir, ignore_errors=True)
+        
+        last_download_file = os.path.join(os.path.dirname(target_dir), "last_download.json")
+        last_download_info = {
+            "timestamp": datetime.now().isoformat(),
+            "directory": cache_meta["directory"],
+            "source_id": source_id,
+            "status": "unchanged",
+            "action": action_name
+        }
+        # Replace rather than write through: last_download.json is usually a
+        # symlink to the previous download's metadata.json
+        tmp_file = f"{last_download_file}.tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(orjson.dumps(last_download_info, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_file, last_download_file)
+        
+        logger.info(f"{source_id}" + (f" action {action_name}" if action_name else "") +
+                    f" is unchanged since {cache_meta['directory']}, keeping the previous download")
+        return "unchanged"
+    
+    async def _get_json(self, url, params=None):
+        """
+        GET a JSON document, retrying transient failures.
+        
+        Args:
+            url (str): The URL to request
+            params (dict, optional): Query string parameters
             
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(all_projects, f, ensure_ascii=False, indent=2)
+        Returns:
+            The parsed JSON response
             
-            logger.info(f"Downloaded {len(all_projects)} OpenAIRE projects and saved to {output_file}")
+        Raises:
+            aiohttp.ClientError: If the request still fails after the last attempt
+        """
+        return orjson.loads(await self._get_body(url, params=params))
+    
+    async def _get_body(self, url, params=None, text=False):
+        """
+        GET a response body, retrying transient failures.
+        
+        Responses with a status in RETRY_STATUSES and connection errors are
+        retried up to REQUEST_RETRIES times in total, with exponential backoff.
+        Other HTTP errors fail straight away.
+        
+        Args:
+            url (str): The URL to request
+            params (dict, optional): Query string parameters
+            text (bool): Decode the body using the response charset
             
-            # Create metadata
-            self._create_metadata(target_dir, source_id, source_config, {
-                "api_url": base_url,
-                "record_count": len(all_projects),
-                "download_timestamp": datetime.now().isoformat(),
-                "action": action_name,
-                "pages_processed": page - 1
-            })
+        Returns:
+            bytes or str: The response body
             
-            # Try to convert to CSV
+        Raises:
+            aiohttp.ClientError: If the request still fails after the last attempt
+        """
+        attempts = max(1, REQUEST_RETRIES)
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            retry_headers = None
             try:
-                # Normalize the complex nested structure
-                flat_projects = []
-                for project in all_projects:
-                    flat_project = {}
-                    
-                    # Extract basic project info
-                    result = project.get("result", {})
-                    metadata = result.get("metadata", {}).get("oaf:entity", {}).get("oaf:project", {})
-                    
-                    # Extract common fields
-                    flat_project["code"] = metadata.get("code", {}).get("$", "")
-                    flat_project["acronym"] = metadata.get("acronym", {}).get("$", "")
-                    flat_project["title"] = metadata.get("title", {}).get("$", "")
-                    
-                    # Handle dates
-                    if "startdate" in metadata:
-                        flat_project["start_date"] = metadata["startdate"].get("$", "")
-                    if "enddate" in metadata:
-                        flat_project["end_date"] = metadata["enddate"].get("$", "")
-                    
-                    # Handle funding
-                    if "fundingtree" in metadata and "funder" in metadata["fundingtree"]:
-                        funders = metadata["fundingtree"]["funder"]
-                        if isinstance(funders, list):
-                            flat_project["funder"] = "; ".join([f.get("shortname", {}).get("$", "") for f in funders])
-                        else:
-                            flat_project["funder"] = funders.get("shortname", {}).get("$", "")
-                    
-                    # Add to flat projects
-                    flat_projects.append(flat_project)
-                
-                # Convert to DataFrame and save as CSV
-                df = pd.DataFrame(flat_projects)
-                csv_file = os.path.join(target_dir, f"{base_name}.csv")
-                df.to_csv(csv_file, index=False)
-                logger.info(f"Converted OpenAIRE data to CSV: {csv_file}")
-                
-            except Exception as e:
-                logger.warning(f"Could not convert OpenAIRE data to CSV: {str(e)}")
+                async with self.session.get(url, params=params) as response:
+                    if response.status in RETRY_STATUSES and not last_attempt:
+                        logger.warning(f"Got HTTP {response.status} from {url}, retrying (attempt {attempt+1}/{attempts})")
+                        retry_headers = response.headers
+                    else:
+                        response.raise_for_status()
+                        return await response.text() if text else await response.read()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if last_attempt:
+                    raise
+                logger.warning(f"Request to {url} failed, retrying (attempt {attempt+1}/{attempts}): {str(e)}")
             
-            return True
-        
-        except Exception as e:
-            logger.error(f"Error processing OpenAIRE API: {str(e)}", exc_info=True)
-            return False
-    
+            await asyncio.sleep(retry_delay(attempt, retry_headers))
     
-
-    def _fetch_api(self, source_id, source_config, target_dir, action_name=None):
+    async def _fetch_api(self, source_id, source_config, target_dir, action_name=None):
         """
         Fetch data from an API endpoint.
         
@@ -393,7 +620,7 @@ class DataFetcher:
         
         # Special handling for OpenAIRE API
         if "openaire" in source_id.lower() or "openaire" in url.lower():
-            return self._fetch_openaire_api(source_id, source_config, target_dir, action_name)
+            return await self._fetch_openaire_api(source_id, source_config, target_dir, action_name)
         
         # Regular API handling for other sources
         parser_type = source_config.get("parser", "api")
@@ -405,75 +632,127 @@ class DataFetcher:
                 # Add authentication logic here
                 logger.info(f"API authentication required for {source_id}")
             
-            # Handle pagination
-            all_data = []
-            page = 1
-            has_more = True
-            
-            while has_more:
-                paginated_url = f"{url}?page={page}" if parser_config.get("pagination") else url
-                logger.info(f"Fetching API data from {paginated_url}")
-                
-                response = self.session.get(paginated_url, timeout=REQUEST_TIMEOUT)
-                response.raise_for_status()
+            # Use action name in filename if provided
+            base_name = f"{source_id}_{action_name}" if action_name else source_id
+            output_file = os.path.join(target_dir, f"{base_name}.json")
+            csv_file = os.path.join(target_dir, f"{base_name}.csv")
+            
+            record_count = 0
+            # Hash of the records, to recognise an API that returned the same data as last time
+            content_hash = hashlib.blake2b(digest_size=16)
+            writer = None
+            csv_rows = 0
+            ragged = False
+            csv_failed = False
+            
+            # Records are written to the JSON array and the CSV as each page
+            # arrives, so only the current page is held in memory
+            with open(output_file, "wb") as json_f, \
+                    open(csv_file, "w", encoding="utf-8", newline="") as csv_f:
+                json_f.write(b"[")
                 
-                data = response.json()
+                # Handle pagination
+                page = 1
+                has_more = True
                 
-                # Extract data based on parser configuration
-                if isinstance(data, list):
-                    all_data.extend(data)
-                elif isinstance(data, dict):
-                    # Handle common API response patterns
-                    if "data" in data and isinstance(data["data"], list):
-                        all_data.extend(data["data"])
-                    elif "results" in data and isinstance(data["results"], list):
-                        all_data.extend(data["results"])
+                while has_more:
+                    paginated_url = f"{url}?page={page}" if parser_config.get("pagination") else url
+                    logger.info(f"Fetching API data from {paginated_url}")
+                    
+                    data = await self._get_json(paginated_url)
+                    
+                    # Extract data based on parser configuration
+                    if isinstance(data, list):
+                        records = data
+                    elif isinstance(data, dict):
+                        # Handle common API response patterns
+                        if "data" in data and isinstance(data["data"], list):
+                            records = data["data"]
+                        elif "results" in data and isinstance(data["results"], list):
+                            records = data["results"]
+                        else:
+                            records = [data]
                     else:
-                        all_data.append(data)
-                
-                # Check if we need to paginate
-                if parser_config.get("pagination"):
-                    # Determine if there's more data based on API response
-                    # This logic might need to be customized per API
-                    has_more = False
-                    if isinstance(data, dict):
-                        if "next" in data and data["next"]:
-                            has_more = True
-                        elif "has_more" in data and data["has_more"]:
-                            has_more = True
+                        records = []
                     
-                    page += 1
-                    # Respect rate limits
-                    if has_more and "rate_limit" in parser_config:
-                        time.sleep(60 / parser_config["rate_limit"])
-                else:
-                    has_more = False
+                    chunks = []
+                    for record in records:
+                        chunks.append((b",\n" if record_count else b"\n") + orjson.dumps(record))
+                        record_count += 1
+                    page_bytes = b"".join(chunks)
+                    content_hash.update(page_bytes)
+                    # Disk writes go to a worker thread so other sources' requests keep flowing
+                    await asyncio.to_thread(json_f.write, page_bytes)
+                    
+                    # Optionally convert to CSV
+                    if not csv_failed:
+                        try:
+                            rows = [self._flatten_record(record) for record in records]
+                            if writer is None:
+                                writer = csv.DictWriter(csv_f, fieldnames=[])
+                            # Columns first seen on a later page are appended; the
+                            # header is completed once all pages are written
+                            known = set(writer.fieldnames)
+                            for row in rows:
+                                for key in row:
+                                    if key not in known:
+                                        known.add(key)
+                                        writer.fieldnames.append(key)
+                                        ragged = ragged or csv_rows > 0
+                            await asyncio.to_thread(writer.writerows, rows)
+                            csv_rows += len(rows)
+                        except Exception as e:
+                            logger.warning(f"Could not convert API data to CSV: {str(e)}")
+                            csv_failed = True
+                    
+                    # Check if we need to paginate
+                    if parser_config.get("pagination"):
+                        # Determine if there's more data based on API response
+                        # This logic might need to be customized per API
+                        has_more = False
+                        if isinstance(data, dict):
+                            if "next" in data and data["next"]:
+                                has_more = True
+                            elif "has_more" in data and data["has_more"]:
+                                has_more = True
+                        
+                        page += 1
+                        # Respect rate limits
+                        if has_more and "rate_limit" in parser_config:
+                            await asyncio.sleep(60 / parser_config["rate_limit"])
+                    else:
+                        has_more = False
+                
+                json_f.write(b"\n]")
             
-            # Save the API response as JSON
-            # Use action name in filename if provided
-            base_name = f"{source_id}_{action_name}" if action_name else source_id
-            output_file = os.path.join(target_dir, f"{base_name}.json")
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(all_data, f, indent=2)
+            source_path = os.path.dirname(target_dir)
+            cache_meta = self._read_cache_meta(source_path, url)
+            content_hash = content_hash.hexdigest()
+            if cache_meta.get("content_hash") == content_hash:
+                return await asyncio.to_thread(self._discard_unchanged_fetch, target_dir, cache_meta, source_id, action_name)
             
             logger.info(f"Successfully saved API data to {output_file}")
             
             # Create metadata
-            self._create_metadata(target_dir, source_id, source_config, {
+            await asyncio.to_thread(self._create_metadata, target_dir, source_id, source_config, {
                 "api_url": url,
-                "record_count": len(all_data),
+                "record_count": record_count,
                 "download_timestamp": datetime.now().isoformat(),
                 "action": action_name
             })
             
-            # Optionally convert to CSV
-            try:
-                df = pd.json_normalize(all_data)
-                csv_file = os.path.join(target_dir, f"{base_name}.csv")
-                df.to_csv(csv_file, index=False)
-                logger.info(f"Converted API data to CSV: {csv_file}")
-            except Exception as e:
-                logger.warning(f"Could not convert API data to CSV: {str(e)}")
+            if csv_failed:
+                os.remove(csv_file)
+            else:
+                try:
+                    await asyncio.to_thread(
+                        self._write_csv_header, csv_file, writer.fieldnames if writer else [], pad=ragged
+                    )
+                    logger.info(f"Converted API data to CSV: {csv_file}")
+                except Exception as e:
+                    logger.warning(f"Could not convert API data to CSV: {str(e)}")
+            
+            await asyncio.to_thread(self._write_cache_meta, source_path, target_dir, url, content_hash)
             
             return True
             
@@ -483,7 +762,279 @@ class DataFetcher:
                         f": {str(e)}", exc_info=True)
             return False
 
-    def _fetch_openaire_api(self, source_id, source_config, target_dir, action_name=None):
+    def _flatten_record(self, record, prefix=""):
+        """
+        Flatten nested dicts into dotted column names, as pandas.json_normalize does.
+        
+        Args:
+            record (dict): A JSON record
+            prefix (str): Column name prefix for nested records
+            
+        Returns:
+            dict: The flattened record
+            
+        Raises:
+            TypeError: If the record is not a JSON object
+        """
+        if not isinstance(record, dict):
+            raise TypeError(f"Expected a JSON object, got {type(record).__name__}")
+        
+        # Most API records are already flat; write those as they are, uncopied
+        if not prefix and not any(isinstance(value, dict) and value for value in record.values()):
+            return record
+        
+        flat = {}
+        for key, value in record.items():
+            if isinstance(value, dict) and value:
+                flat.update(self._flatten_record(value, f"{prefix}{key}."))
+            else:
+                flat[f"{prefix}{key}"] = value
+        return flat
+    
+    def _write_csv_header(self, csv_file, fieldnames, pad=False):
+        """
+        Put the header row at the top of a CSV whose rows were written without one.
+        
+        Args:
+            csv_file (str): The CSV file to complete
+            fieldnames (list): The full list of columns
+            pad (bool): Whether some rows were written before all columns were
+                known and need empty trailing fields added
+        """
+        tmp_file = f"{csv_file}.tmp"
+        with open(csv_file, "r", encoding="utf-8", newline="") as src, \
+                open(tmp_file, "w", encoding="utf-8", newline="") as dst:
+            if fieldnames:
+                csv.writer(dst).writerow(fieldnames)
+            if pad:
+                writer = csv.writer(dst)
+                padding = [""] * len(fieldnames)
+                for row in csv.reader(src):
+                    writer.writerow(row + padding[len(row):])
+            else:
+                shutil.copyfileobj(src, dst)
+        os.replace(tmp_file, csv_file)
+    
+    async def _fetch_openaire_page(self, base_url, page, size):
+        """
+        Fetch one page of OpenAIRE search results.
+        
+        Args:
+            base_url (str): The OpenAIRE search endpoint
+            page (int): The 1-based page number
+            size (int): The number of results per page
+            
+        Returns:
+            dict: The parsed JSON response
+        """
+        params = {
+            "format": "json",
+            "page": page,
+            "size": size
+        }
+        
+        await self.openaire_limiter.wait()
+        return await self._get_json(base_url, params=params)
+    
+    def _openaire_projects(self, data):
+        """
+        Get the list of projects from an OpenAIRE response.
+        
+        Args:
+            data (dict): The parsed JSON response
+            
+        Returns:
+            list: The projects on the page (empty when there are none)
+        """
+        results = (data.get("response") or {}).get("results") or {}
+        projects = results.get("result", [])
+        
+        # Ensure projects is a list
+        if not isinstance(projects, list):
+            projects = [projects] if projects else []
+        
+        return projects
+    
+    def _openaire_total_pages(self, data, size):
+        """
+        Get the number of result pages announced in an OpenAIRE response header.
+        
+        Args:
+            data (dict): The parsed JSON response
+            size (int): The number of results per page
+            
+        Returns:
+            int: The number of pages, or None if the header has no usable total
+        """
+        if "response" not in data:
+            return None
+        
+        # Safely extract total results
+        header = data["response"].get("header", {})
+        total_str = header.get("total", {})
+        
+        # Handle various formats of 'total'
+        if isinstance(total_str, dict) and "$" in total_str:
+            total_str = total_str.get("$", "0")
+        elif isinstance(total_str, dict):
+            total_str = next(iter(total_str.values()), "0")
+        
+        try:
+            total_results = int(total_str)
+        except (ValueError, TypeError):
+            logger.warning(f"Could not determine total projects, will continue until no more results")
+            return None
+        
+        total_pages = (total_results + size - 1) // size
+        logger.info(f"Total OpenAIRE projects: {total_results} (approx. {total_pages} pages)")
+        return total_pages
+    
+    async def _iter_openaire_pages(self, base_url, size):
+        """
+        Yield the projects of every OpenAIRE result page, in page order.
+        
+        The first page is fetched on its own to learn the total and to probe
+        the page size: a size the server rejects is halved and retried, and a
+        size it silently caps is lowered to what it actually returned. When the
+        total is known up to OPENAIRE_MAX_CONCURRENCY of the remaining pages are
+        requested at once; otherwise pages are walked one at a time
+        until an empty page comes back.
+        
+        Iteration stops at the first page that fails, so the pages yielded
+        are always a contiguous prefix of the results.
+        
+        Args:
+            base_url (str): The OpenAIRE search endpoint
+            size (int): The preferred number of results per page
+            
+        Yields:
+            tuple: (page number, list of projects)
+            
+        Raises:
+            OpenAIREPageError: If a page cannot be fetched
+        """
+        while True:
+            logger.info(f"Fetching OpenAIRE API page 1 (page size {size})")
+            try:
+                data = await self._fetch_openaire_page(base_url, 1, size)
+                break
+            except aiohttp.ClientResponseError as e:
+                if size <= OPENAIRE_MIN_PAGE_SIZE:
+                    raise OpenAIREPageError(1, e) from e
+                logger.warning(f"OpenAIRE rejected page size {size} ({e.status}), retrying with {size // 2}")
+                size = max(size // 2, OPENAIRE_MIN_PAGE_SIZE)
+            except Exception as e:
+                raise OpenAIREPageError(1, e) from e
+        logger.debug(f"OpenAIRE API response structure: {list(data.keys())}")
+        
+        projects = self._openaire_projects(data)
+        if not projects:
+            logger.info("No more projects. Stopping.")
+            return
+        
+        # A short first page with more results announced means the server caps
+        # the page size; the page is still the first len(projects) results
+        total_pages = self._openaire_total_pages(data, size)
+        if len(projects) < size and total_pages is not None and total_pages > 1:
+            size = len(projects)
+            logger.info(f"OpenAIRE capped the page size at {size}")
+            total_pages = self._openaire_total_pages(data, size)
+        
+        yield 1, projects
+        
+        if total_pages is not None:
+            # Safety limit - don't go beyond 1000 pages
+            if total_pages > OPENAIRE_MAX_PAGES:
+                logger.warning(f"Reached maximum page limit ({OPENAIRE_MAX_PAGES}). Stopping.")
+                total_pages = OPENAIRE_MAX_PAGES
+            
+            # A sliding window of in-flight requests: pages are yielded in order
+            # as soon as they complete, so finished pages don't pile up in memory
+            pages = iter(range(2, total_pages + 1))
+            in_flight = deque()
+            try:
+                for page in itertools.islice(pages, OPENAIRE_MAX_CONCURRENCY):
+                    in_flight.append((page, asyncio.ensure_future(self._fetch_openaire_page(base_url, page, size))))
+                while in_flight:
+                    page, task = in_flight.popleft()
+                    try:
+                        data = await task
+                    except Exception as e:
+                        # Later pages would leave a hole; the rest are cancelled below
+                        raise OpenAIREPageError(page, e) from e
+                    next_page = next(pages, None)
+                    if next_page is not None:
+                        in_flight.append((next_page, asyncio.ensure_future(self._fetch_openaire_page(base_url, next_page, size))))
+                    yield page, self._openaire_projects(data)
+            finally:
+                for _, task in in_flight:
+                    task.cancel()
+            return
+        
+        # Without a total, walk the pages until the API runs out of results
+        page = 2
+        while page <= OPENAIRE_MAX_PAGES:
+            logger.info(f"Fetching OpenAIRE API page {page}")
+            try:
+                data = await self._fetch_openaire_page(base_url, page, size)
+            except Exception as e:
+                raise OpenAIREPageError(page, e) from e
+            
+            projects = self._openaire_projects(data)
+            if not projects:
+                logger.info("No more projects. Stopping.")
+                return
+            yield page, projects
+            page += 1
+        
+        logger.warning(f"Reached maximum page limit ({OPENAIRE_MAX_PAGES}). Stopping.")
+    
+    def _flatten_openaire_project(self, project):
+        """
+        Flatten one nested OpenAIRE project into a CSV row.
+        
+        Args:
+            project (dict): A project as returned by the OpenAIRE API
+            
+        Returns:
+            dict: Flat project fields keyed by OPENAIRE_CSV_FIELDS
+        """
+        flat_project = {}
+        
+        try:
+            # Extract basic project info
+            metadata = project.get("metadata", {})
+            if "oaf:entity" in metadata:
+                metadata = metadata["oaf:entity"].get("oaf:project", {})
+            
+            # Extract common fields - each is either a {"$": text} dict or a bare value
+            flat_project["code"] = _openaire_text(metadata.get("code", ""))
+            flat_project["acronym"] = _openaire_text(metadata.get("acronym", ""))
+            flat_project["title"] = _openaire_text(metadata.get("title", ""))
+            
+            # Handle dates
+            if "startdate" in metadata:
+                flat_project["start_date"] = _openaire_text(metadata["startdate"])
+            if "enddate" in metadata:
+                flat_project["end_date"] = _openaire_text(metadata["enddate"])
+            
+            # Handle funding
+            if "fundingtree" in metadata and "funder" in metadata["fundingtree"]:
+                funders = metadata["fundingtree"]["funder"]
+                if isinstance(funders, list):
+                    funder_names = (_openaire_text(f.get("shortname", "")) for f in funders)
+                    flat_project["funder"] = "; ".join(name for name in funder_names if name)
+                else:
+                    flat_project["funder"] = _openaire_text(funders.get("shortname", ""))
+        except Exception as e:
+            logger.warning(f"Error flattening project: {str(e)}")
+            # Still add what we have
+            if not flat_project:
+                flat_project["raw_id"] = str(project.get("id", "unknown"))
+        
+        return flat_project
+    
+    async def _fetch_openaire_api(self, source_id, source_config, target_dir, action_name=None):
         """
         Special handler for the OpenAIRE API.
         
@@ -502,184 +1053,115 @@ class DataFetcher:
             logger.info(f"Fetching OpenAIRE projects data")
             
             # Initialize variables
-            all_projects = []
-            page = 1
-            size = 100  # Max size allowed by API
-            total_pages = None
-            
-            # Fetch projects with pagination
-            while True:
-                logger.info(f"Fetching OpenAIRE API page {page}" + 
-                        (f" of {total_pages}" if total_pages else ""))
+            pages_processed = 0
+            record_count = 0
+            content_hash = hashlib.blake2b(digest_size=16)
+            # Larger pages mean fewer round trips; the server-side limit is probed on page 1
+            size = int(source_config.get("page_size") or OPENAIRE_PAGE_SIZE)
+            
+            base_name = f"{source_id}_{action_name}" if action_name else source_id
+            output_file = os.path.join(target_dir, f"{base_name}.json")
+            parquet_file = os.path.join(target_dir, f"{base_name}.parquet")
+            csv_file = os.path.join(target_dir, f"{base_name}.csv")
+            
+            # The flattened table is written as Parquet; a CSV copy is opt-in per source
+            write_csv = str(source_config.get("csv_output", "False")).lower() in ["true", "1", "yes", "y", "t"]
+            output_files = [output_file, parquet_file] + ([csv_file] if write_csv else [])
+            
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+            import pyarrow.parquet as pq
+            
+            schema = pa.schema([(name, pa.string()) for name in OPENAIRE_CSV_FIELDS])
+            
+            # Each page is written to the JSON array as it arrives, and flattened
+            # projects are flushed to the table writers a row group at a time, so
+            # memory stays bounded by the pages in flight plus one row group
+            with contextlib.ExitStack() as stack:
+                json_f = stack.enter_context(open(output_file, "wb"))
+                writers = [stack.enter_context(pq.ParquetWriter(
+                    parquet_file, schema, compression="zstd", compression_level=3
+                ))]
+                if write_csv:
+                    writers.append(stack.enter_context(pacsv.CSVWriter(csv_file, schema)))
+                flat_projects = []
+                
+                def flush():
+                    table = pa.Table.from_pylist(flat_projects, schema=schema)
+                    for writer in writers:
+                        writer.write_table(table)
+                    flat_projects.clear()
                 
-                params = {
-                    "format": "json",
-                    "page": page,
-                    "size": size
-                }
+                json_f.write(b"[")
                 
+                # Fetch projects with pagination
                 try:
-                    response = self.session.get(base_url, params=params, timeout=REQUEST_TIMEOUT)
-                    response.raise_for_status()
-                    data = response.json()
-                    
-                    # Debug response structure
-                    logger.debug(f"OpenAIRE API response structure: {json.dumps(list(data.keys()), indent=2)}")
-                    
-                    # Get project list
-                    projects = data.get("response", {}).get("results", {}).get("result", [])
-                    
-                    # Ensure projects is a list
-                    if not isinstance(projects, list):
-                        if projects:  # If it's a single project
-                            projects = [projects]
-                        else:
-                            projects = []
-                    
-                    # Get pagination info if not already set
-                    if total_pages is None and "response" in data:
-                        # Safely extract total results
-                        header = data["response"].get("header", {})
-                        total_str = header.get("total", {})
-                        
-                        # Handle various formats of 'total'
-                        if isinstance(total_str, dict) and "$" in total_str:
-                            total_str = total_str.get("$", "0")
-                        elif isinstance(total_str, dict):
-                            total_str = next(iter(total_str.values()), "0")
-                        
-                        try:
-                            total_results = int(total_str)
-                            total_pages = (total_results + size - 1) // size
-                            logger.info(f"Total OpenAIRE projects: {total_results} (approx. {total_pages} pages)")
-                        except (ValueError, TypeError):
-                            logger.warning(f"Could not determine total projects, will continue until no more results")
-                    
-                    if not projects:
-                        logger.info("No more projects. Stopping.")
-                        break
-                    
-                    # Add projects to our collection
-                    all_projects.extend(projects)
-                    logger.info(f"Downloaded {len(projects)} projects from page {page}")
-                    
-                    # Move to next page
-                    page += 1
-                    time.sleep(1)  # Be nice to the API
-                    
-                    # Safety check - if we've processed more pages than expected
-                    if total_pages and page > total_pages + 5:
-                        logger.warning(f"Exceeded expected number of pages ({total_pages}). Stopping.")
-                        break
-                    
-                    # Safety limit - don't go beyond 1000 pages
-                    if page > 1000:
-                        logger.warning("Reached maximum page limit (1000). Stopping.")
-                        break
-                    
-                except Exception as e:
-                    logger.error(f"Error on page {page}: {str(e)}")
-                    # Save what we have so far
-                    if all_projects:
-                        break
-                    else:
-                        return False
+                    async for page, projects in self._iter_openaire_pages(base_url, size):
+                        chunks = []
+                        for project in projects:
+                            chunks.append((b",\n" if record_count else b"\n") + orjson.dumps(project))
+                            record_count += 1
+                            flat_projects.append(self._flatten_openaire_project(project))
+                        page_bytes = b"".join(chunks)
+                        content_hash.update(page_bytes)
+                        # Disk writes go to a worker thread so page requests keep flowing
+                        await asyncio.to_thread(json_f.write, page_bytes)
+                        if len(flat_projects) >= PARQUET_ROW_GROUP_SIZE:
+                            await asyncio.to_thread(flush)
+                        pages_processed += 1
+                        logger.info(f"Downloaded {len(projects)} projects from page {page}")
+                except OpenAIREPageError as e:
+                    # Only a failed page request lands here; any other error
+                    # propagates and keeps the pages already on disk
+                    logger.error(str(e))
+                    failed_page = e.page
+                else:
+                    failed_page = None
+                
+                if flat_projects:
+                    await asyncio.to_thread(flush)
+                json_f.write(b"\n]")
             
-            # Save all data
-            base_name = f"{source_id}_{action_name}" if action_name else source_id
-            output_file = os.path.join(target_dir, f"{base_name}.json")
+            if failed_page == 1:
+                for path in output_files:
+                    os.remove(path)
+                return False
             
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(all_projects, f, ensure_ascii=False, indent=2)
+            if failed_page is not None:
+                # Keep the contiguous pages for inspection, but don't let an
+                # incomplete download become the latest one or count as fresh
+                logger.error(f"OpenAIRE download incomplete: kept {record_count} projects from pages 1-{failed_page - 1}")
+                await asyncio.to_thread(self._create_metadata, target_dir, source_id, source_config, {
+                    "api_url": base_url,
+                    "record_count": record_count,
+                    "download_timestamp": datetime.now().isoformat(),
+                    "action": action_name,
+                    "pages_processed": pages_processed,
+                    "status": "Incomplete",
+                    "failed_page": failed_page
+                }, link_last_download=False)
+                return False
             
-            logger.info(f"Downloaded {len(all_projects)} OpenAIRE projects and saved to {output_file}")
+            source_path = os.path.dirname(target_dir)
+            cache_meta = self._read_cache_meta(source_path, base_url)
+            content_hash = content_hash.hexdigest()
+            if cache_meta.get("content_hash") == content_hash:
+                return await asyncio.to_thread(self._discard_unchanged_fetch, target_dir, cache_meta, source_id, action_name)
+            
+            logger.info(f"Downloaded {record_count} OpenAIRE projects and saved to {output_file}")
+            logger.info(f"Converted OpenAIRE data to Parquet: {parquet_file}")
+            if write_csv:
+                logger.info(f"Converted OpenAIRE data to CSV: {csv_file}")
             
             # Create metadata
-            self._create_metadata(target_dir, source_id, source_config, {
+            await asyncio.to_thread(self._create_metadata, target_dir, source_id, source_config, {
                 "api_url": base_url,
-                "record_count": len(all_projects),
+                "record_count": record_count,
                 "download_timestamp": datetime.now().isoformat(),
                 "action": action_name,
-                "pages_processed": page - 1
+                "pages_processed": pages_processed
             })
-            
-            # Try to convert to CSV
-            try:
-                # Normalize the complex nested structure
-                flat_projects = []
-                for project in all_projects:
-                    flat_project = {}
-                    
-                    try:
-                        # Extract basic project info
-                        metadata = project.get("metadata", {})
-                        if "oaf:entity" in metadata:
-                            metadata = metadata["oaf:entity"].get("oaf:project", {})
-                        
-                        # Extract common fields - safely handle different structures
-                        if isinstance(metadata.get("code", {}), dict):
-                            flat_project["code"] = metadata.get("code", {}).get("$", "")
-                        else:
-                            flat_project["code"] = str(metadata.get("code", ""))
-                            
-                        if isinstance(metadata.get("acronym", {}), dict):
-                            flat_project["acronym"] = metadata.get("acronym", {}).get("$", "")
-                        else:
-                            flat_project["acronym"] = str(metadata.get("acronym", ""))
-                            
-                        if isinstance(metadata.get("title", {}), dict):
-                            flat_project["title"] = metadata.get("title", {}).get("$", "")
-                        else:
-                            flat_project["title"] = str(metadata.get("title", ""))
-                        
-                        # Handle dates
-                        if "startdate" in metadata:
-                            if isinstance(metadata["startdate"], dict):
-                                flat_project["start_date"] = metadata["startdate"].get("$", "")
-                            else:
-                                flat_project["start_date"] = str(metadata["startdate"])
-                                
-                        if "enddate" in metadata:
-                            if isinstance(metadata["enddate"], dict):
-                                flat_project["end_date"] = metadata["enddate"].get("$", "")
-                            else:
-                                flat_project["end_date"] = str(metadata["enddate"])
-                        
-                        # Handle funding
-                        if "fundingtree" in metadata and "funder" in metadata["fundingtree"]:
-                            funders = metadata["fundingtree"]["funder"]
-                            if isinstance(funders, list):
-                                funder_names = []
-                                for f in funders:
-                                    if isinstance(f.get("shortname", {}), dict):
-                                        name = f.get("shortname", {}).get("$", "")
-                                    else:
-                                        name = str(f.get("shortname", ""))
-                                    if name:
-                                        funder_names.append(name)
-                                flat_project["funder"] = "; ".join(funder_names)
-                            else:
-                                if isinstance(funders.get("shortname", {}), dict):
-                                    flat_project["funder"] = funders.get("shortname", {}).get("$", "")
-                                else:
-                                    flat_project["funder"] = str(funders.get("shortname", ""))
-                    except Exception as e:
-                        logger.warning(f"Error flattening project: {str(e)}")
-                        # Still add what we have
-                        if not flat_project:
-                            flat_project["raw_id"] = str(project.get("id", "unknown"))
-                    
-                    # Add to flat projects
-                    flat_projects.append(flat_project)
-                
-                # Convert to DataFrame and save as CSV
-                df = pd.DataFrame(flat_projects)
-                csv_file = os.path.join(target_dir, f"{base_name}.csv")
-                df.to_csv(csv_file, index=False)
-                logger.info(f"Converted OpenAIRE data to CSV: {csv_file}")
-                
-            except Exception as e:
-                logger.warning(f"Could not convert OpenAIRE data to CSV: {str(e)}")
+            await asyncio.to_thread(self._write_cache_meta, source_path, target_dir, base_url, content_hash)
             
             return True
         
@@ -687,7 +1169,7 @@ class DataFetcher:
             logger.error(f"Error processing OpenAIRE API: {str(e)}", exc_info=True)
             return False
     
-    def _fetch_file(self, source_id, source_config, target_dir, action_name=None):
+    async def _fetch_file(self, source_id, source_config, target_dir, action_name=None):
         """
         Download a file (CSV or Excel) from a URL.
         
@@ -724,22 +1206,55 @@ class DataFetcher:
         if not verify_ssl:
             logger.warning(f"SSL verification disabled for {source_id}")
         
+        # Conditional GET against the previous download of this URL
+        source_path = os.path.dirname(target_dir)
+        cache_meta = self._read_cache_meta(source_path, url)
+        headers = {}
+        if cache_meta.get("etag"):
+            headers["If-None-Match"] = cache_meta["etag"]
+        if cache_meta.get("last_modified"):
+            headers["If-Modified-Since"] = cache_meta["last_modified"]
+        
         # Download the file with retries
+        use_ranges = True
         for attempt in range(REQUEST_RETRIES):
+            ranged_length = None
             try:
                 logger.info(f"Downloading {url} (attempt {attempt+1}/{REQUEST_RETRIES})")
-                response = self.session.get(
+                async with self.session.get(
                     url, 
-                    timeout=REQUEST_TIMEOUT, 
-                    stream=True,
-                    verify=verify_ssl  # Set SSL verification based on source config
-                )
-                response.raise_for_status()
+                    headers=headers,
+                    ssl=verify_ssl  # Set SSL verification based on source config
+                ) as response:
+                    if response.status == 304:
+                        return await asyncio.to_thread(self._discard_unchanged_fetch, target_dir, cache_meta, source_id, action_name)
+                    response.raise_for_status()
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+                    
+                    if use_ranges:
+                        ranged_length = self._ranged_download_length(response)
+                    if ranged_length:
+                        # Drop this connection; the body comes in parallel ranges instead
+                        response.close()
+                    else:
+                        # Save the file, hashing it on the way for servers without validators
+                        content_hash = hashlib.blake2b(digest_size=16)
+                        with open(filepath, "wb") as f:
+                            async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                                # Disk writes go to a worker thread so the loop keeps serving other fetches
+                                await asyncio.to_thread(f.write, chunk)
+                                content_hash.update(chunk)
+                        content_hash = content_hash.hexdigest()
                 
-                # Save the file
-                with open(filepath, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+                if ranged_length:
+                    # If-Range makes the server send 200 instead of a part if the
+                    # file changes mid-download; weak ETags aren't allowed there
+                    validator = etag if etag and not etag.startswith("W/") else last_modified
+                    content_hash = await self._download_ranged(url, filepath, ranged_length, verify_ssl, validator)
+                
+                if cache_meta.get("content_hash") == content_hash:
+                    return await asyncio.to_thread(self._discard_unchanged_fetch, target_dir, cache_meta, source_id, action_name)
                 
                 logger.info(f"Successfully downloaded {url} to {filepath}")
                 
@@ -749,7 +1264,8 @@ class DataFetcher:
                 
                 # Verify the file by attempting to load it
                 try:
-                    self._verify_file(filepath, source_config.get("format"))
+                    # Verification parses the whole file; keep it off the event loop
+                    await asyncio.to_thread(self._verify_file, filepath, source_config.get("format"))
                 except Exception as e:
                     # If the file exists and has content, consider it a successful download
                     # even if verification failed
@@ -762,7 +1278,7 @@ class DataFetcher:
                         raise
                 
                 # Create metadata file
-                self._create_metadata(target_dir, source_id, source_config, {
+                await asyncio.to_thread(self._create_metadata, target_dir, source_id, source_config, {
                     "download_url": url,
                     "download_timestamp": datetime.now().isoformat(),
                     "file_size_bytes": file_size,
@@ -770,19 +1286,30 @@ class DataFetcher:
                     "action": action_name,
                     "verification_passed": file_valid
                 })
+                await asyncio.to_thread(self._write_cache_meta, source_path, target_dir, url, content_hash, etag, last_modified)
                 
                 # Return true even if verification failed but file exists
                 return True
                 
-            except requests.exceptions.RequestException as e:
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 logger.warning(f"Download attempt {attempt+1} failed: {str(e)}")
                 
-                # If SSL verification is the issue and we haven't disabled it yet, try again with verification disabled
-                if "CERTIFICATE_VERIFY_FAILED" in str(e) and verify_ssl and attempt == REQUEST_RETRIES - 2:
+                # Retry a failed ranged download as a single stream
+                if ranged_length:
+                    use_ranges = False
+                
+                # Errors like 403/404 won't go away on a retry
+                if isinstance(e, aiohttp.ClientResponseError) and e.status not in RETRY_STATUSES:
+                    logger.error(f"Failed to download {url}: HTTP {e.status}")
+                    return False
+                
+                # If SSL verification is the issue and we haven't disabled it yet, try again straight away with verification disabled
+                if isinstance(e, aiohttp.ClientConnectorCertificateError) and verify_ssl and attempt < REQUEST_RETRIES - 1:
                     logger.warning(f"SSL certificate verification failed for {url}, attempting without verification")
                     verify_ssl = False
                 elif attempt < REQUEST_RETRIES - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                    # Exponential backoff, or the server's Retry-After
+                    await asyncio.sleep(retry_delay(attempt, getattr(e, "headers", None), backoff=1))
                 else:
                     logger.error(f"Failed to download {url} after {REQUEST_RETRIES} attempts")
                     return False
@@ -795,7 +1322,7 @@ class DataFetcher:
                     logger.warning(f"File was downloaded but processing failed. Marking as partially successful.")
                     
                     # Create metadata with error indication
-                    self._create_metadata(target_dir, source_id, source_config, {
+                    await asyncio.to_thread(self._create_metadata, target_dir, source_id, source_config, {
                         "download_url": url,
                         "download_timestamp": datetime.now().isoformat(),
                         "file_size_bytes": os.path.getsize(filepath),
@@ -810,7 +1337,102 @@ class DataFetcher:
                 else:
                     return False
     
-    def _fetch_html(self, source_id, source_config, target_dir, action_name=None):
+    def _ranged_download_length(self, response):
+        """
+        Decide whether a download should be split into parallel byte ranges.
+        
+        Args:
+            response (aiohttp.ClientResponse): The response to the plain GET
+            
+        Returns:
+            int: The file size when the server accepts byte ranges, sends the
+                file uncompressed and it is at least RANGED_DOWNLOAD_MIN_SIZE;
+                otherwise None
+        """
+        if response.status != 200 or response.headers.get("Accept-Ranges", "").lower() != "bytes":
+            return None
+        # Ranges of a compressed response would be ranges of the compressed bytes
+        if response.headers.get("Content-Encoding", "identity").lower() != "identity":
+            return None
+        length = response.content_length
+        if not length or length < RANGED_DOWNLOAD_MIN_SIZE:
+            return None
+        return length
+    
+    async def _download_ranged(self, url, filepath, length, verify_ssl=True, validator=None):
+        """
+        Download a file as RANGED_DOWNLOAD_PARTS concurrent byte ranges.
+        
+        Each part writes straight to its offset in a pre-sized file.
+        
+        Args:
+            url (str): The file URL
+            filepath (str): Where to save the file
+            length (int): The file size in bytes
+            verify_ssl (bool): Whether to verify the server's certificate
+            validator (str, optional): ETag or Last-Modified sent as If-Range
+            
+        Returns:
+            str: BLAKE2b hash of the downloaded file
+            
+        Raises:
+            aiohttp.ClientPayloadError: If the server ignores a range or a part
+                comes back short
+        """
+        part_size = -(-length // RANGED_DOWNLOAD_PARTS)
+        
+        def presize():
+            with open(filepath, "wb") as f:
+                f.truncate(length)
+        
+        await asyncio.to_thread(presize)
+        
+        async def fetch_part(start):
+            end = min(start + part_size, length) - 1
+            headers = {"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"}
+            if validator:
+                headers["If-Range"] = validator
+            async with self.session.get(url, headers=headers, ssl=verify_ssl) as response:
+                response.raise_for_status()
+                if response.status != 206:
+                    raise aiohttp.ClientPayloadError(f"Server ignored the byte range for {url} (HTTP {response.status})")
+                written = 0
+                with open(filepath, "r+b") as f:
+                    f.seek(start)
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        await asyncio.to_thread(f.write, chunk)
+                        written += len(chunk)
+            if written != end - start + 1:
+                raise aiohttp.ClientPayloadError(f"Byte range {start}-{end} of {url} came back with {written} bytes")
+        
+        logger.info(f"Downloading {url} in {RANGED_DOWNLOAD_PARTS} parallel ranges ({length} bytes)")
+        tasks = [asyncio.ensure_future(fetch_part(start)) for start in range(0, length, part_size)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # Stop the remaining parts if one of them failed
+            for task in tasks:
+                task.cancel()
+        
+        return await asyncio.to_thread(self._hash_file, filepath)
+    
+    def _hash_file(self, filepath):
+        """
+        Hash a file the same way downloads are hashed while streaming.
+        
+        Args:
+            filepath (str): The file to hash
+            
+        Returns:
+            str: BLAKE2b (16-byte digest) hex hash of the file contents
+        """
+        content_hash = hashlib.blake2b(digest_size=16)
+        with open(filepath, "rb") as f:
+            for block in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+                content_hash.update(block)
+        return content_hash.hexdigest()
+    
+    async def _fetch_html(self, source_id, source_config, target_dir, action_name=None):
         """
         Fetch data by scraping HTML content and using LLM to extract structured data.
         
@@ -823,7 +1445,7 @@ class DataFetcher:
         Returns:
             bool: True if successful, False otherwise
         """
-        url = source_config.get("data_link") or source_config.get("data_link")
+        url = source_config.get("data_link")
         if not url:
             logger.error(f"No URL provided for HTML scraping of source {source_id}" + 
                         (f" action {action_name}" if action_name else ""))
@@ -832,43 +1454,29 @@ class DataFetcher:
         try:
             # Simple request-based scraping
             logger.info(f"Fetching HTML from {url}")
-            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
+            html_content = await self._get_body(url, text=True)
             
             # Save the raw HTML
             # Use action name in filename if provided
             base_name = f"{source_id}_{action_name}" if action_name else source_id
             html_file = os.path.join(target_dir, f"{base_name}.html")
-            with open(html_file, "w", encoding="utf-8") as f:
-                f.write(response.text)
+            await asyncio.to_thread(Path(html_file).write_text, html_content, encoding="utf-8")
             
             logger.info(f"Saved raw HTML to {html_file}")
             
             # Process HTML with LLM
-            extracted_data = self._extract_data_with_llm(response.text, source_id, source_config, action_name)
+            extracted_data = await self._extract_data_with_llm(
+                html_content, source_id, source_config, action_name, target_dir
+            )
             
             if extracted_data:
-                # Save as JSON
-                json_file = os.path.join(target_dir, f"{base_name}.json")
-                with open(json_file, "w", encoding="utf-8") as f:
-                    json.dump(extracted_data, f, indent=2)
-                logger.info(f"Saved extracted JSON data to {json_file}")
-                
-                # Also save as CSV if possible
-                try:
-                    if isinstance(extracted_data, list) and len(extracted_data) > 0:
-                        df = pd.DataFrame(extracted_data)
-                        csv_file = os.path.join(target_dir, f"{base_name}.csv")
-                        df.to_csv(csv_file, index=False)
-                        logger.info(f"Saved extracted CSV data to {csv_file}")
-                except Exception as e:
-                    logger.warning(f"Could not convert extracted data to CSV: {str(e)}")
+                await asyncio.to_thread(self._save_extracted_data, extracted_data, target_dir, base_name)
             
             # Create metadata
-            self._create_metadata(target_dir, source_id, source_config, {
+            await asyncio.to_thread(self._create_metadata, target_dir, source_id, source_config, {
                 "scrape_url": url,
                 "download_timestamp": datetime.now().isoformat(),
-                "html_size_bytes": len(response.text),
+                "html_size_bytes": len(html_content),
                 "action": action_name,
                 "llm_processed": True
             })
@@ -881,36 +1489,114 @@ class DataFetcher:
                         f": {str(e)}", exc_info=True)
             return False
 
-    def _extract_data_with_llm(self, html_content, source_id, source_config, action_name=None):
+    def _save_extracted_data(self, extracted_data, target_dir, base_name):
+        """
+        Save LLM-extracted records as JSON and, for a non-empty list, as CSV.
+        
+        Args:
+            extracted_data (dict/list): The structured data returned by the LLM
+            target_dir (str): The directory to save the files in
+            base_name (str): File name without extension
+        """
+        # Save as JSON
+        json_file = os.path.join(target_dir, f"{base_name}.json")
+        with open(json_file, "wb") as f:
+            f.write(orjson.dumps(extracted_data, option=orjson.OPT_INDENT_2))
+        logger.info(f"Saved extracted JSON data to {json_file}")
+        
+        # Also save as CSV if possible
+        try:
+            if isinstance(extracted_data, list) and len(extracted_data) > 0:
+                # Columns in first-seen order across all records, as a DataFrame would have them
+                fieldnames = list(dict.fromkeys(key for record in extracted_data for key in record))
+                csv_file = os.path.join(target_dir, f"{base_name}.csv")
+                with open(csv_file, "w", newline="", encoding="utf-8") as f:
+                    writer = csv.DictWriter(f, fieldnames=fieldnames)
+                    writer.writeheader()
+                    writer.writerows(extracted_data)
+                logger.info(f"Saved extracted CSV data to {csv_file}")
+        except Exception as e:
+            logger.warning(f"Could not convert extracted data to CSV: {str(e)}")
+    
+    def _truncate_for_llm(self, text_content, source_id):
+        """
+        Cut page text down to LLM_MAX_INPUT_TOKENS tokens.
+        
+        Counts tokens with tiktoken when it is installed, so the budget is used
+        in full; otherwise falls back to LLM_MAX_INPUT_CHARS characters.
+        
+        Args:
+            text_content (str): The page text
+            source_id (str): The source identifier (for logging)
+            
+        Returns:
+            str: The text, truncated if it was over budget
+        """
+        if DataFetcher._token_encoder is None:
+            try:
+                import tiktoken
+                DataFetcher._token_encoder = tiktoken.encoding_for_model(LLM_MODEL)
+            except Exception as e:
+                logger.info(f"tiktoken unavailable, truncating LLM input by characters: {str(e)}")
+                DataFetcher._token_encoder = False
+        
+        encoder = DataFetcher._token_encoder
+        if encoder:
+            tokens = encoder.encode(text_content, disallowed_special=())
+            if len(tokens) > LLM_MAX_INPUT_TOKENS:
+                logger.warning(f"HTML content truncated for LLM processing (source: {source_id})")
+                return encoder.decode(tokens[:LLM_MAX_INPUT_TOKENS])
+        elif len(text_content) > LLM_MAX_INPUT_CHARS:
+            logger.warning(f"HTML content truncated for LLM processing (source: {source_id})")
+            return text_content[:LLM_MAX_INPUT_CHARS]
+        return text_content
+    
+    def _html_to_text(self, html_content, source_id):
+        """
+        Reduce a scraped page to the text sent to the LLM.
+        
+        Args:
+            html_content (str): The HTML content to process
+            source_id (str): The source identifier (for logging)
+            
+        Returns:
+            str: The page's readable text, truncated to the LLM input budget
+        """
+        # Clean HTML content - extract text or reduce size if needed
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(html_content, HTML_PARSER)
+        
+        # Drop elements without readable text; decompose() frees them in place
+        for tag in soup(["script", "style", "noscript", "svg"]):
+            tag.decompose()
+            
+        # Get text content
+        text_content = soup.get_text(separator='\n', strip=True)
+        
+        # Truncate content to what fits in the model's context
+        return self._truncate_for_llm(text_content, source_id)
+    
+    async def _extract_data_with_llm(self, html_content, source_id, source_config, action_name=None, target_dir=None):
         """
         Extract structured data from HTML content using an LLM API.
         
+        The request goes over the shared aiohttp session, so extractions for
+        different sources overlap; at most LLM_MAX_CONCURRENCY run at once.
+        
         Args:
             html_content (str): The HTML content to process
             source_id (str): The source identifier
             source_config (dict): The source configuration
             action_name (str, optional): The name of the action
+            target_dir (str, optional): Where to save an unparseable response for debugging
             
         Returns:
             dict/list: Extracted structured data or None if extraction failed
         """
+        extracted_text = ""
         try:
-            # Clean HTML content - extract text or reduce size if needed
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.extract()
-                
-            # Get text content
-            text_content = soup.get_text(separator='\n', strip=True)
-            
-            # Truncate content if too large (OpenAI has ~8k token limit for gpt-3.5-turbo)
-            max_chars = 32000  # Approximate character limit (~8k tokens)
-            if len(text_content) > max_chars:
-                text_content = text_content[:max_chars]
-                logger.warning(f"HTML content truncated for LLM processing (source: {source_id})")
+            # Parsing a large page is CPU-bound; keep it off the event loop
+            text_content = await asyncio.to_thread(self._html_to_text, html_content, source_id)
             
             # Create prompt based on source and action
             source_desc = f"{source_config.get('funder', '')} - {action_name}" if action_name else source_config.get('funder', '')
@@ -922,82 +1608,64 @@ class DataFetcher:
                 return None
             
             # Identify the type of data to extract based on the source
-            prompt = f"""
-            You are an expert at extracting structured data from HTML content. 
-            The following text is from the website of {source_desc}, which contains information about funded projects or grants.
-            
-            Please extract all the available project information into a structured JSON array format. 
-            Each project should include fields like:
-            - project_title
-            - principal_investigator
-            - institution
-            - funding_amount (with currency if available)
-            - funding_year
-            - duration (if available)
-            - description
-            - research_area
-            
-            Include any other relevant fields you find. Use null for missing values.
-            Return ONLY the JSON array with no additional text or explanation.
-            
-            Here's the content:
-            {text_content}
-            """
+            prompt = LLM_PROMPT_TEMPLATE.format(source_desc=source_desc, text_content=text_content)
             
             logger.info(f"Sending content to OpenAI API for extraction (source: {source_id})")
             
             # Make API request to OpenAI
-            import requests
             headers = {
                 "Content-Type": "application/json",
                 "Authorization": f"Bearer {api_key}"
             }
             
-            # Default to gpt-3.5-turbo if available, otherwise try gpt-4
-            model = "gpt-3.5-turbo-16k"
-            
             payload = {
-                "model": model,
+                "model": LLM_MODEL,
                 "messages": [{"role": "user", "content": prompt}],
                 "temperature": 0.2,  # Lower temperature for more deterministic output
                 "max_tokens": 8000
             }
             
-            response = requests.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers=headers, 
-                json=payload, 
-                timeout=180  # Longer timeout for LLM
-            )
-            response.raise_for_status()
-            
-            # Parse the LLM response
-            llm_response = response.json()
-            print(llm_response)
+            async with self.llm_semaphore:
+                async with self.session.post(
+                    LLM_API_URL,
+                    headers=headers,
+                    data=orjson.dumps(payload),
+                    # Longer read timeout for LLM: nothing arrives until generation ends
+                    timeout=aiohttp.ClientTimeout(total=None, sock_connect=REQUEST_TIMEOUT, sock_read=LLM_TIMEOUT)
+                ) as response:
+                    response.raise_for_status()
+                    
+                    # Parse the LLM response
+                    llm_response = orjson.loads(await response.read())
             extracted_text = llm_response.get("choices", [{}])[0].get("message", {}).get("content", "")
             
             # Clean up the response to ensure it's valid JSON
-            # Remove markdown code fences if present
+            # Remove markdown code fences if present, with a single slice
             extracted_text = extracted_text.strip()
             if extracted_text.startswith("```json"):
-                extracted_text = extracted_text[7:]
+                start = 7
             elif extracted_text.startswith("```"):
-                extracted_text = extracted_text[3:]
-            if extracted_text.endswith("```"):
-                extracted_text = extracted_text[:-3]
-            extracted_text = extracted_text.strip()
-
-            print(extracted_text)
+                start = 3
+            else:
+                start = 0
+            end = -3 if len(extracted_text) >= start + 3 and extracted_text.endswith("```") else None
+            extracted_text = extracted_text[start:end].strip()
+            
+            # Responses can be hundreds of KB; only format them when debug logging is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"LLM response for {source_id}: {extracted_text}")
             
             # Parse the JSON
-            extracted_data = json.loads(extracted_text)
+            extracted_data = orjson.loads(extracted_text)
             logger.info(f"Successfully extracted structured data with LLM: {len(extracted_data) if isinstance(extracted_data, list) else 'N/A'} items")
             
             return extracted_data
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse LLM response as JSON: {str(e)}")
             # Try to save the raw response for debugging
+            if not target_dir:
+                return None
             try:
                 debug_file = os.path.join(target_dir, f"{source_id}_llm_response.txt")
                 with open(debug_file, "w", encoding="utf-8") as f:
@@ -1009,7 +1677,6 @@ class DataFetcher:
         except Exception as e:
             logger.error(f"Error extracting data with LLM: {str(e)}", exc_info=True)
             return None
-  
     
     def _verify_file(self, filepath, file_format):
         """
@@ -1024,13 +1691,23 @@ class DataFetcher:
         """
         try:
             if file_format.lower() in ["csv"]:
-                # First attempt: standard reading
+                # First attempt: parse the header and first block with pyarrow's
+                # streaming reader instead of loading the whole file
                 try:
-                    df = pd.read_csv(filepath)
-                    logger.info(f"CSV verification: {len(df)} rows, {len(df.columns)} columns")
+                    import pyarrow.csv as pa_csv
+                    
+                    reader = pa_csv.open_csv(filepath, read_options=pa_csv.ReadOptions(block_size=1 << 20))
+                    try:
+                        batch = reader.read_next_batch()
+                    except StopIteration:
+                        batch = None
+                    finally:
+                        reader.close()
+                    sample_rows = batch.num_rows if batch is not None else 0
+                    logger.info(f"CSV verification: {len(reader.schema)} columns, first block of {sample_rows} rows parsed")
                     return
                 except Exception as e:
-                    logger.warning(f"Standard CSV reading failed: {str(e)}")
+                    logger.warning(f"Streaming CSV reading failed: {str(e)}")
                     
                 # Second attempt: try with different parsing options
                 try:
@@ -1046,7 +1723,6 @@ class DataFetcher:
                 
                 # Third attempt: try with different quoting and delimiter options
                 try:
-                    import csv
                     df = pd.read_csv(filepath, quoting=csv.QUOTE_NONE, escapechar='\\')
                     logger.info(f"CSV verification (with QUOTE_NONE): {len(df)} rows, {len(df.columns)} columns")
                     return
@@ -1059,7 +1735,6 @@ class DataFetcher:
                         sample = f.read(4096)  # Read a sample of the file
                         
                     # Try to detect the dialect
-                    import csv
                     dialect = csv.Sniffer().sniff(sample)
                     logger.info(f"Detected CSV dialect: delimiter='{dialect.delimiter}', quotechar='{dialect.quotechar}'")
                     
@@ -1086,8 +1761,32 @@ class DataFetcher:
                     logger.error(f"Failed to read file as text: {str(e)}")
                     raise
                 
+            elif file_format.lower() == "parquet":
+                # The footer holds the schema and row counts, so no row data is read
+                import pyarrow.parquet as pq
+                
+                parquet_meta = pq.read_metadata(filepath)
+                logger.info(f"Parquet verification: {parquet_meta.num_rows} rows, {parquet_meta.num_columns} columns")
+                return
+                
             elif file_format.lower() in ["excel", "xlsx"]:
-                # First attempt: standard reading
+                # First attempt: read each sheet's dimensions in read-only mode,
+                # which streams the workbook instead of building DataFrames of it
+                try:
+                    import openpyxl
+                    
+                    workbook = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+                    try:
+                        for sheet in workbook.worksheets:
+                            logger.info(f"Excel verification, sheet '{sheet.title}': "
+                                        f"{sheet.max_row} rows (including header), {sheet.max_column} columns")
+                    finally:
+                        workbook.close()
+                    return
+                except Exception as e:
+                    logger.warning(f"Read-only Excel reading failed: {str(e)}")
+                
+                # Second attempt: standard reading (also covers legacy .xls)
                 try:
                     df = pd.read_excel(filepath)
                     logger.info(f"Excel verification: {len(df)} rows, {len(df.columns)} columns")
@@ -1122,7 +1821,7 @@ class DataFetcher:
             logger.error(f"File verification failed: {str(e)}")
             raise
     
-    def _create_metadata(self, directory, source_id, source_config, extra_info=None):
+    def _create_metadata(self, directory, source_id, source_config, extra_info=None, link_last_download=True):
         """
         Create a metadata file with information about the fetch.
         
@@ -1130,8 +1829,12 @@ class DataFetcher:
             directory (str): The directory to create the metadata file in
             source_id (str): The source identifier
             source_config (dict): The source configuration
-            extra_info (dict, optional): Additional information to include in the metadata
+            extra_info (dict, optional): Additional information to include in the metadata.
+                Its "download_timestamp", when given, is reused as the metadata timestamp
+            link_last_download (bool): Whether to point last_download.json at this
+                metadata (False for downloads that must not count as the last one)
         """
+        extra_info = extra_info or {}
         metadata = {
             "source_id": source_id,
             "funder": source_config.get("funder", ""),
@@ -1140,76 +1843,116 @@ class DataFetcher:
             "type": source_config.get("type", ""),
             "status": "Downloaded",
             "format": source_config.get("format", ""),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": extra_info.get("download_timestamp") or datetime.now().isoformat(),
+            "directory": os.path.basename(directory),
         }
         
-        if extra_info:
-            metadata.update(extra_info)
+        metadata.update(extra_info)
         
         metadata_file = os.path.join(directory, "metadata.json")
-        with open(metadata_file, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2)
+        with open(metadata_file, "wb") as f:
+            f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+        logger.info(f"Created metadata file: {metadata_file}")
+        
+        if not link_last_download:
+            return
         
-        # Also create/update the "last_download.json" file in the source directory
+        # Also point the source directory's "last_download.json" at this metadata:
+        # a relative symlink, swapped in atomically, instead of a second JSON file
         source_dir = os.path.dirname(directory)
         last_download_file = os.path.join(source_dir, "last_download.json")
+        tmp_link = f"{last_download_file}.tmp"
+        try:
+            if os.path.lexists(tmp_link):
+                os.unlink(tmp_link)
+            os.symlink(os.path.join(os.path.basename(directory), "metadata.json"), tmp_link)
+            os.replace(tmp_link, last_download_file)
+        except (OSError, NotImplementedError):
+            # Without symlink support, write the summary out as before
+            if os.path.lexists(tmp_link):
+                os.unlink(tmp_link)
+            last_download_info = {
+                "timestamp": metadata["timestamp"],
+                "directory": metadata["directory"],
+                "source_id": source_id,
+                "status": "success",
+                "action": metadata.get("action")
+            }
+            with open(last_download_file, "wb") as f:
+                f.write(orjson.dumps(last_download_info, option=orjson.OPT_INDENT_2))
         
-        last_download_info = {
-            "timestamp": datetime.now().isoformat(),
-            "directory": os.path.basename(directory),
-            "source_id": source_id,
-            "status": "success",
-            "action": extra_info.get("action") if extra_info else None
-        }
-        
-        with open(last_download_file, "w", encoding="utf-8") as f:
-            json.dump(last_download_info, f, indent=2)
-        
-        logger.info(f"Created metadata file: {metadata_file}")
         logger.info(f"Updated last download info: {last_download_file}")
     
-    def _is_recently_downloaded(self, source_path, max_age_days=7):
+    def _read_manifest(self):
         """
-        Check if a source has been downloaded recently.
+        Load the fetch manifest.
+        
+        Returns:
+            dict: action_id -> last fetch time (epoch seconds), empty when
+                there is no manifest yet
+        """
+        try:
+            with open(FETCH_MANIFEST_FILE, "rb") as f:
+                return orjson.loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable fetch manifest {FETCH_MANIFEST_FILE}: {str(e)}")
+            return {}
+    
+    def _write_manifest(self):
+        """Write the fetch manifest atomically (temporary file + rename)."""
+        try:
+            os.makedirs(RAW_DATA_DIR, exist_ok=True)
+            tmp_file = f"{FETCH_MANIFEST_FILE}.tmp"
+            with open(tmp_file, "wb") as f:
+                f.write(orjson.dumps(self.manifest, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+            os.replace(tmp_file, FETCH_MANIFEST_FILE)
+        except OSError as e:
+            logger.warning(f"Could not write fetch manifest {FETCH_MANIFEST_FILE}: {str(e)}")
+    
+    def _is_fresh(self, action_id, source_path, max_age_days=7):
+        """
+        Check whether an action was fetched within max_age_days.
+        
+        Answered from the fetch manifest. An action missing from it (e.g. the
+        first run after the manifest was introduced) falls back to its
+        last_download.json, and the manifest is seeded from that.
         
         Args:
-            source_path (str): The path to the source directory
+            action_id (str): The source + action identifier
+            source_path (str): The path to the source (or source/action) directory
             max_age_days (int): Maximum age in days to consider a download recent
             
         Returns:
-            bool: True if the source was downloaded within the specified time frame
+            bool: True if the action was fetched within the specified time frame
         """
-        last_download_file = os.path.join(source_path, "last_download.json")
-        
-        # If the last_download.json file doesn't exist, the source hasn't been downloaded
-        if not os.path.exists(last_download_file):
-            return False
+        if action_id not in self.manifest:
+            # last_download.json is only written by completed or unchanged
+            # fetches, so its mtime is the fetch time; no need to parse it
+            try:
+                self.manifest[action_id] = os.stat(os.path.join(source_path, "last_download.json")).st_mtime
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Error checking last download for {source_path}: {str(e)}")
         
-        try:
-            # Read the last download information
-            with open(last_download_file, "r", encoding="utf-8") as f:
-                last_download = json.load(f)
-            
-            # Parse the timestamp
-            download_time = datetime.fromisoformat(last_download.get("timestamp", ""))
-            current_time = datetime.now()
-            
-            # Calculate the age in days
-            age_days = (current_time - download_time).total_seconds() / (60 * 60 * 24)
-            
-            # Check if the download is recent enough
-            if age_days <= max_age_days:
-                action_info = f" action {last_download.get('action')}" if last_download.get('action') else ""
-                logger.info(f"Source at {source_path}{action_info} was downloaded {age_days:.1f} days ago (max age: {max_age_days} days)")
-                return True
-            else:
-                action_info = f" action {last_download.get('action')}" if last_download.get('action') else ""
-                logger.info(f"Source at {source_path}{action_info} download is {age_days:.1f} days old, exceeding max age of {max_age_days} days")
-                return False
-                
-        except Exception as e:
-            logger.warning(f"Error checking last download for {source_path}: {str(e)}")
-            return False
+        last_fetch = self.manifest.get(action_id, 0)
+        if last_fetch > time.time() - max_age_days * 86400:
+            logger.info(f"{action_id} was fetched {(time.time() - last_fetch) / 86400:.1f} days ago (max age: {max_age_days} days)")
+            return True
+        return False
+
+
+# Fetcher for each source format
+FORMAT_DISPATCH = {
+    "csv": DataFetcher._fetch_file,
+    "excel": DataFetcher._fetch_file,
+    "xlsx": DataFetcher._fetch_file,
+    "parquet": DataFetcher._fetch_file,
+    "api": DataFetcher._fetch_api,
+    "html": DataFetcher._fetch_html
+}
 
 
 def initialize_from_csv(csv_path):
@@ -1351,9 +2094,11 @@ def main():
     # If specific sources are requested, filter DATA_SOURCES
     if args.sources:
         source_filter = {}
-        for source_id in args.sources:
-            if source_id in DATA_SOURCES:
-                source_filter[source_id] = DATA_SOURCES[source_id]
+        # dict.fromkeys drops repeated IDs while keeping the requested order
+        for source_id in dict.fromkeys(args.sources):
+            source_config = DATA_SOURCES.get(source_id)
+            if source_config is not None:
+                source_filter[source_id] = source_config
             else:
                 print(f"Warning: Source '{source_id}' not found in configuration")
         
@@ -1361,21 +2106,24 @@ def main():
             print("Error: None of the specified sources were found")
             return
         
-        # Make a temporary copy of filtered sources and use it
-        temp_sources = source_filter.copy()
-        results = fetcher.fetch_all_sources(temp_sources, force_refresh=args.force, max_age_days=args.max_age)
+        results = asyncio.run(fetcher.fetch_all_sources(source_filter, force_refresh=args.force, max_age_days=args.max_age))
     else:
         # Fetch all sources
-        results = fetcher.fetch_all_sources(DATA_SOURCES, force_refresh=args.force, max_age_days=args.max_age)
+        results = asyncio.run(fetcher.fetch_all_sources(DATA_SOURCES, force_refresh=args.force, max_age_days=args.max_age))
     
-    # Report results
-    successful = [source for source, result in results.items() if result is True]
-    failed = [source for source, result in results.items() if result is False]
-    skipped = [source for source, result in results.items() if result == "skipped"]
+    # Report results, grouped by outcome in a single pass
+    buckets = {True: [], False: [], "skipped": [], "unchanged": []}
+    for source, result in results.items():
+        bucket = buckets.get(result)
+        if bucket is not None:
+            bucket.append(source)
+    successful, failed = buckets[True], buckets[False]
+    skipped, unchanged = buckets["skipped"], buckets["unchanged"]
     
     print("\n===== FETCH SUMMARY =====")
     print(f"Successfully fetched: {len(successful)}/{len(results)} sources")
     print(f"Skipped (already downloaded): {len(skipped)}/{len(results)} sources")
+    print(f"Unchanged since last download: {len(unchanged)}/{len(results)} sources")
     print(f"Failed: {len(failed)}/{len(results)} sources")
     
     if successful:
@@ -1388,6 +2136,11 @@ def main():
         for source in skipped:
             print(f"  ⏭️ {source}")
     
+    if unchanged:
+        print("\nUnchanged sources (previous download kept):")
+        for source in unchanged:
+            print(f"  🔁 {source}")
+    
     if failed:
         print("\nFailed sources:")
         for source in failed:
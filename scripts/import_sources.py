@@ -6,8 +6,11 @@ This script imports data source definitions from a CSV file and generates
 config/sources.py with the imported data.
 """
 
+import io
 import os
+import re
 import sys
+import orjson
 import pandas as pd
 from pathlib import Path
 
@@ -15,6 +18,72 @@ from pathlib import Path
 project_root = Path(__file__).resolve().parent.parent
 sys.path.append(str(project_root))
 
+# Characters dropped from source IDs; \W is exactly "not str.isalnum() and not '_'"
+NON_ID_CHARS = re.compile(r"\W")
+
+# CSV column -> source config key, in the order the keys are written, with the
+# value used when the column is absent from the CSV
+SOURCE_COLUMNS = {
+    'Funder': ('funder', ''),
+    'Action': ('action', ''),
+    'Source_name': ('source_name', ''),
+    'Country': ('country', ''),
+    'Type': ('type', ''),
+    'Status': ('status', 'Not started'),
+    'Link to web': ('web_link', ''),
+    'Link to dump': ('data_link', ''),
+    'Format': ('format', ''),
+    'Size': ('size', ''),
+    'Notes': ('notes', ''),
+    'skip_ssl_verify': ('skip_ssl_verify', False),
+}
+
+# Static parts of the generated sources.py, around the DATA_SOURCES dict
+SOURCES_PY_HEADER = '''"""
+Configuration file for data sources in OpenJordi.
+This file defines the structure and access information for all grant data sources.
+"""
+
+# Data sources configuration
+DATA_SOURCES = '''
+SOURCES_PY_FOOTER = '''
+
+# Add more data sources as needed
+
+# Parser definitions - specify how to handle different data formats
+PARSER_CONFIGS = {
+    "standard_csv": {
+        "encoding": "utf-8",
+        "delimiter": ",",
+        "quotechar": '"',
+        "date_format": "%Y-%m-%d"
+    },
+    "excel": {
+        "sheet_name": 0,  # Default to first sheet
+        "date_format": "%Y-%m-%d"
+    },
+    "api": {
+        "auth_required": False,
+        "pagination": False,
+        "rate_limit": 60  # requests per minute
+    },
+    "html": {
+        "use_selenium": False,
+        "wait_time": 2,
+        "selectors": {}
+    }
+}'''
+
+# Parser type for each (lowercase) format; anything else is parsed as standard CSV
+PARSER_TYPES = {
+    'csv': 'standard_csv',
+    'excel': 'excel',
+    'xlsx': 'excel',
+    'xls': 'excel',
+    'api': 'api',
+    'html': 'html',
+}
+
 
 def import_sources_from_csv(csv_path):
     """
@@ -31,8 +100,12 @@ def import_sources_from_csv(csv_path):
         return False
     
     try:
-        # Read the CSV file
-        df = pd.read_csv(csv_path)
+        # Read the CSV file with pyarrow's multithreaded parser, falling back to
+        # pandas' own when pyarrow isn't installed or can't parse the file
+        try:
+            df = pd.read_csv(csv_path, engine='pyarrow')
+        except (ImportError, ValueError):
+            df = pd.read_csv(csv_path)
         required_columns = ['Funder', 'Source_name', 'Country', 'Type', 'Link to dump', 'Format']
         
         # Verify required columns
@@ -71,88 +144,45 @@ def generate_sources_py(df):
     """
     sources_dict = {}
     
-    for _, row in df.iterrows():
+    # Rename the columns to config keys once, filling in absent optional columns,
+    # so rows can be read as plain tuples instead of a Series per row
+    df = pd.DataFrame({
+        key: df[column] if column in df.columns else default
+        for column, (key, default) in SOURCE_COLUMNS.items()
+    }, index=df.index)
+    
+    # Determine parser type based on format, for all rows at once
+    df['format'] = df['format'].astype(str).str.lower()
+    df['parser'] = df['format'].map(PARSER_TYPES).fillna('standard_csv')
+    
+    for row in df.itertuples(index=False):
         # Create a source ID from the funder name (cleaned)
-        source_id = clean_source_id(row.get('Source_name', '')) + "-" + clean_source_id(row.get('Action', ''))
+        source_id = clean_source_id(row.source_name) + "-" + clean_source_id(row.action)
         
         if not source_id:
             continue
         
-        # Determine parser type based on format
-        format_type = str(row.get('Format', '')).lower()
-        parser = determine_parser_type(format_type)
-        
         # Create source configuration
-        sources_dict[source_id] = {
-            'funder': row.get('Funder', ''),
-            'action': row.get('Action', ''),
-            'source_name': row.get('Source_name', ''),
-            'country': row.get('Country', ''),
-            'type': row.get('Type', ''),
-            'status': row.get('Status', 'Not started'),
-            'web_link': row.get('Link to web', ''),
-            'data_link': row.get('Link to dump', ''),
-            'format': format_type,
-            'size': row.get('Size', ''),
-            'notes': row.get('Notes', ''),
-            'skip_ssl_verify': row.get('skip_ssl_verify', False),
-            'parser': parser
+        sources_dict[source_id] = row._asdict()
+    
+    # Values are written as strings, with missing ones as "". JSON string
+    # syntax is also a valid Python literal, so the whole dict is serialized
+    # in one orjson call (quotes and backslashes in values come out escaped)
+    sources = {
+        source_id: {
+            key: "" if value is None or str(value) == 'nan' else str(value)
+            for key, value in config.items()
         }
+        for source_id, config in sources_dict.items()
+    }
     
     # Generate Python code
-    code = [
-        '"""',
-        'Configuration file for data sources in OpenJordi.',
-        'This file defines the structure and access information for all grant data sources.',
-        '"""',
-        '',
-        '# Data sources configuration',
-        'DATA_SOURCES = {'
-    ]
-    
-    for source_id, config in sources_dict.items():
-        code.append(f'    "{source_id}": {{')
-        for key, value in config.items():
-            # Handle None values
-            if value is None or str(value) == 'nan':
-                code.append(f'        "{key}": "",')
-            else:
-                code.append(f'        "{key}": "{value}",')
-        code.append('    },')
+    buf = io.StringIO()
+    buf.write(SOURCES_PY_HEADER)
+    buf.write(orjson.dumps(sources, option=orjson.OPT_INDENT_2).decode("utf-8"))
+    buf.write(SOURCES_PY_FOOTER)
     
-    code.append('}')
-    code.append('')
-    code.append('# Add more data sources as needed')
-    code.append('')
-    
-    # Add parser configurations
-    code.extend([
-        '# Parser definitions - specify how to handle different data formats',
-        'PARSER_CONFIGS = {',
-        '    "standard_csv": {',
-        '        "encoding": "utf-8",',
-        '        "delimiter": ",",',
-        '        "quotechar": \'"\',',
-        '        "date_format": "%Y-%m-%d"',
-        '    },',
-        '    "excel": {',
-        '        "sheet_name": 0,  # Default to first sheet',
-        '        "date_format": "%Y-%m-%d"',
-        '    },',
-        '    "api": {',
-        '        "auth_required": False,',
-        '        "pagination": False,',
-        '        "rate_limit": 60  # requests per minute',
-        '    },',
-        '    "html": {',
-        '        "use_selenium": False,',
-        '        "wait_time": 2,',
-        '        "selectors": {}',
-        '    }',
-        '}'
-    ])
-    
-    return '\n'.join(code)
+    return buf.getvalue()
 
 
 def clean_source_id(name):
@@ -169,34 +199,7 @@ def clean_source_id(name):
         return ""
     
     # Replace spaces, remove special characters
-    cleaned = name.replace(' ', '_')
-    cleaned = ''.join(c for c in cleaned if c.isalnum() or c == '_')
-    
-    return cleaned
-
-
-def determine_parser_type(format_type):
-    """
-    Determine the parser type based on the format
-    
-    Args:
-        format_type (str): The format type
-        
-    Returns:
-        str: Parser type
-    """
-    format_type = str(format_type).lower()
-    
-    if format_type == 'csv':
-        return 'standard_csv'
-    elif format_type in ['excel', 'xlsx', 'xls']:
-        return 'excel'
-    elif format_type == 'api':
-        return 'api'
-    elif format_type == 'html':
-        return 'html'
-    else:
-        return 'standard_csv'
+    return NON_ID_CHARS.sub('', name.replace(' ', '_'))
 
 
 def main():
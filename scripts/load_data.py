@@ -1,18 +1,69 @@
 # scripts/clean_data.py
+import asyncio
+import os
+import sys
 import openai
 
-def clean_data():
+MODEL = "gpt-4"
+CHUNK_SIZE = 4096  # Characters per request, split on paragraph boundaries
+MAX_CONCURRENCY = 8  # Requests in flight at once
+FAILED_CHUNKS_FILE = "data/failed_chunks.txt"  # Raw text of chunks the model couldn't clean
+
+def split_paragraphs(text, chunk_size=CHUNK_SIZE):
+    # Group whole paragraphs into chunks of about chunk_size characters
+    chunks, current, size = [], [], 0
+    for paragraph in text.split("\n\n"):
+        if current and size + len(paragraph) > chunk_size:
+            chunks.append("\n\n".join(current))
+            current, size = [], 0
+        current.append(paragraph)
+        size += len(paragraph) + 2
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+async def clean_chunk(client, semaphore, chunk):
+    async with semaphore:
+        response = await client.chat.completions.create(
+            model=MODEL,
+            messages=[{"role": "system", "content": "Clean and structure grant data."},
+                      {"role": "user", "content": chunk}]
+        )
+    return response.choices[0].message.content
+
+async def clean_data_async():
     with open("data/raw_data.txt", "r") as file:
         raw_data = file.read()
-    response = openai.ChatCompletion.create(
-        model="gpt-4",
-        messages=[{"role": "system", "content": "Clean and structure grant data."},
-                  {"role": "user", "content": raw_data}]
-    )
-    cleaned_data = response["choices"][0]["message"]["content"]
+    client = openai.AsyncOpenAI()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    chunks = split_paragraphs(raw_data)
+    # Chunks are cleaned concurrently; gather keeps them in file order, and a
+    # failed chunk doesn't cancel the others
+    results = await asyncio.gather(*[clean_chunk(client, semaphore, chunk) for chunk in chunks], return_exceptions=True)
+    cleaned_chunks, failed_chunks = [], []
+    for number, (chunk, result) in enumerate(zip(chunks, results), 1):
+        if isinstance(result, Exception):
+            print(f"Failed to clean chunk {number}/{len(chunks)}: {result}")
+            failed_chunks.append(f"### Chunk {number}/{len(chunks)}\n{chunk}")
+        else:
+            cleaned_chunks.append(result)
+    cleaned_data = "\n\n".join(cleaned_chunks)
     with open("data/cleaned_data.txt", "w") as file:
         file.write(cleaned_data)
+    if failed_chunks:
+        # Uncleaned text goes to its own file so it never mixes with the cleaned data
+        with open(FAILED_CHUNKS_FILE, "w") as file:
+            file.write("\n\n".join(failed_chunks))
+        print(f"{len(failed_chunks)} chunk(s) could not be cleaned; raw text saved to {FAILED_CHUNKS_FILE}")
+        return False
+    # Don't leave failures from an earlier run next to a clean output
+    if os.path.exists(FAILED_CHUNKS_FILE):
+        os.remove(FAILED_CHUNKS_FILE)
     print("Data cleaned successfully.")
+    return True
+
+def clean_data():
+    return asyncio.run(clean_data_async())
 
 if __name__ == "__main__":
-    clean_data()
\ No newline at end of file
+    sys.exit(0 if clean_data() else 1)
\ No newline at end of file
@@ -1,21 +1,10 @@
 # mapping_dataset_name.py
 
-import datetime
 import pandas as pd
 
-# Helper function to parse dates
-def parse_date(date_str):
-    try:
-        return datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
-    except ValueError:
-        return None
-
-# Function to extract investigator names (assuming the format is "Given Family")
-def extract_investigator_names(name_str):
-    parts = name_str.split(" ")
-    if len(parts) > 1:
-        return {"given_name": parts[0], "family_name": parts[1]}
-    return {"given_name": None, "family_name": None}
+# Helper function to parse a column of dates (unparseable values become NaT)
+def parse_dates(date_strs):
+    return pd.to_datetime(date_strs, format="%Y-%m-%d", errors="coerce").dt.date
 
 # Mapping dictionary
 mapping_dict = {
@@ -36,21 +25,24 @@ def apply_and_rename(df):
 
     # Split the Project Period (FY) into start_date and end_date
     if 'Project Period (FY)' in df.columns:
-        df['start_date'], df['end_date'] = zip(*df['Project Period (FY)'].map(lambda x: [parse_date(date) for date in x.split(" – ")]))
+        period = df['Project Period (FY)'].str.split(" – ")
+        df['start_date'] = parse_dates(period.str[0])
+        df['end_date'] = parse_dates(period.str[1])
         mapped_columns.add('start_date')
         mapped_columns.add('end_date')
     
-    # Extract the investigator names only once
+    # Extract the investigator names only once (assuming the format is "Given Family")
     if 'Principal Investigator' in df.columns:
-        df['Principal Investigator'] = df['Principal Investigator'].map(lambda x: extract_investigator_names(x))
+        names = df['Principal Investigator'].str.split(" ")
+        has_family_name = names.str.len() > 1
 
         # Extract given_name and family_name and map them only the first time they appear
         if 'investigator_given_name' not in mapped_columns:
-            df['investigator_given_name'] = df['Principal Investigator'].apply(lambda x: x['given_name'])
+            df['investigator_given_name'] = names.str[0].where(has_family_name)
             mapped_columns.add('investigator_given_name')
         
         if 'investigator_family_name' not in mapped_columns:
-            df['investigator_family_name'] = df['Principal Investigator'].apply(lambda x: x['family_name'])
+            df['investigator_family_name'] = names.str[1].where(has_family_name)
             mapped_columns.add('investigator_family_name')
 
     # Prepare the new DataFrame with renamed columns based on the mapping
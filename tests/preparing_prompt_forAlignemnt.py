@@ -1,5 +1,15 @@
 Given the following dataset columns extracted from an external source, map them to the closest matching attribute from the provided ontology.  
 
+### **Shared Example Values:**  
+Some columns have the same example value. Each shared value is given once here, and the columns below refer to it by name (e.g. `<ABSTRACT_TEXT>`).
+```
+INVESTIGATOR_TEXT = "田中 萌子 東京大学, 大学院医学系研究科(医学部), 助教 (51002125)"
+BREAKDOWN_TEXT = "2024:180000 2025:480000"
+ABSTRACT_TEXT = "妊婦の睡眠が阻害されると妊娠・出産に重大な悪影響を及ぼすため、適切な睡眠衛生環境 を築くことが重要である。妊婦の夜間睡眠は分断されやすく疲労が蓄積しやすい。効果的な昼寝をとることにより回復を促せる可能性がある一方、過度な昼寝は夜間の睡眠を障害する可能性もある。しかし従来の研究は日常生活下の連続的な睡眠測定が不十分であった。
+本研究は昼寝を含めた妊婦の睡眠実態を睡眠計を用いた精緻な測定により定量化し、日誌と組み合わせて検討することで場面やタイミングを考慮して詳細に解明する。
+得られたデータから健康や労働生産性への影響を探索し、妊婦に適切な睡眠の量や質を確保するための環境整備に資する知見を得る。"
+```
+
 ### **Dataset Columns with Example Values:**  
 ```
 ATRIBUTE_NAME: VALUE_EXAMPLE
@@ -7,13 +17,13 @@ ATRIBUTE_NAME: VALUE_EXAMPLE
 **Project Title (English)**: "Associations between  sleep quality, napping, and the health and work performace of pregnant women: a prospective cohort study"
 **Project/Area Number**: "24K23710"
 **Project Period (FY)**: "2024-07-31 – 2026-03-31"
-**Principal Investigator**: "田中 萌子 東京大学, 大学院医学系研究科(医学部), 助教 (51002125)"
-**Co-Investigator(Kenkyū-buntansha)**: "田中 萌子 東京大学, 大学院医学系研究科(医学部), 助教 (51002125)"
-**Co-Investigator(Renkei-kenkyūsha)**: "田中 萌子 東京大学, 大学院医学系研究科(医学部), 助教 (51002125)"
-**Research Collaborator**: "田中 萌子 東京大学, 大学院医学系研究科(医学部), 助教 (51002125)"
-**Research Fellow**: "田中 萌子 東京大学, 大学院医学系研究科(医学部), 助教 (51002125)"
-**Foreign Research Fellow**: "田中 萌子 東京大学, 大学院医学系研究科(医学部), 助教 (51002125)"
-**Host Researcher**: "田中 萌子 東京大学, 大学院医学系研究科(医学部), 助教 (51002125)"
+**Principal Investigator**: <INVESTIGATOR_TEXT>
+**Co-Investigator(Kenkyū-buntansha)**: <INVESTIGATOR_TEXT>
+**Co-Investigator(Renkei-kenkyūsha)**: <INVESTIGATOR_TEXT>
+**Research Collaborator**: <INVESTIGATOR_TEXT>
+**Research Fellow**: <INVESTIGATOR_TEXT>
+**Foreign Research Fellow**: <INVESTIGATOR_TEXT>
+**Host Researcher**: <INVESTIGATOR_TEXT>
 **Keywords**: "sleep quality / physical activity / pregnancy / work performance / mental health"
 **Research Field**: "sleep quality / physical activity / pregnancy / work performance / mental health"
 **Review Section**: "0908:社会医学、看護学およびその関連分野"
@@ -25,52 +35,24 @@ ATRIBUTE_NAME: VALUE_EXAMPLE
 **Indirect Cost (Overall)**: "660000.0"
 **Total Cost (Breakdown)**: "2024:780000 2025:2080000"
 **Direct Cost (Breakdown)**: "2024:600000 2025:1600000"
-**Indirect Cost (Breakdown)**: "2024:180000 2025:480000"
-**Progress Status (Status Code)**: "2024:180000 2025:480000"
-**Current Status of Research Progress**: "2024:180000 2025:480000"
-**Reason**: "2024:180000 2025:480000"
-**Outline of Research at the Start**: "妊婦の睡眠が阻害されると妊娠・出産に重大な悪影響を及ぼすため、適切な睡眠衛生環境 を築くことが重要である。妊婦の夜間睡眠は分断されやすく疲労が蓄積しやすい。効果的な昼寝をとることにより回復を促せる可能性がある一方、過度な昼寝は夜間の睡眠を障害する可能性もある。しかし従来の研究は日常生活下の連続的な睡眠測定が不十分であった。
-本研究は昼寝を含めた妊婦の睡眠実態を睡眠計を用いた精緻な測定により定量化し、日誌と組み合わせて検討することで場面やタイミングを考慮して詳細に解明する。
-得られたデータから健康や労働生産性への影響を探索し、妊婦に適切な睡眠の量や質を確保するための環境整備に資する知見を得る。"
-**Research Abstract**: "妊婦の睡眠が阻害されると妊娠・出産に重大な悪影響を及ぼすため、適切な睡眠衛生環境 を築くことが重要である。妊婦の夜間睡眠は分断されやすく疲労が蓄積しやすい。効果的な昼寝をとることにより回復を促せる可能性がある一方、過度な昼寝は夜間の睡眠を障害する可能性もある。しかし従来の研究は日常生活下の連続的な睡眠測定が不十分であった。
-本研究は昼寝を含めた妊婦の睡眠実態を睡眠計を用いた精緻な測定により定量化し、日誌と組み合わせて検討することで場面やタイミングを考慮して詳細に解明する。
-得られたデータから健康や労働生産性への影響を探索し、妊婦に適切な睡眠の量や質を確保するための環境整備に資する知見を得る。"
-**Research Abstract (English)**: "妊婦の睡眠が阻害されると妊娠・出産に重大な悪影響を及ぼすため、適切な睡眠衛生環境 を築くことが重要である。妊婦の夜間睡眠は分断されやすく疲労が蓄積しやすい。効果的な昼寝をとることにより回復を促せる可能性がある一方、過度な昼寝は夜間の睡眠を障害する可能性もある。しかし従来の研究は日常生活下の連続的な睡眠測定が不十分であった。
-本研究は昼寝を含めた妊婦の睡眠実態を睡眠計を用いた精緻な測定により定量化し、日誌と組み合わせて検討することで場面やタイミングを考慮して詳細に解明する。
-得られたデータから健康や労働生産性への影響を探索し、妊婦に適切な睡眠の量や質を確保するための環境整備に資する知見を得る。"
-**Outline of Final Research Achievements**: "妊婦の睡眠が阻害されると妊娠・出産に重大な悪影響を及ぼすため、適切な睡眠衛生環境 を築くことが重要である。妊婦の夜間睡眠は分断されやすく疲労が蓄積しやすい。効果的な昼寝をとることにより回復を促せる可能性がある一方、過度な昼寝は夜間の睡眠を障害する可能性もある。しかし従来の研究は日常生活下の連続的な睡眠測定が不十分であった。
-本研究は昼寝を含めた妊婦の睡眠実態を睡眠計を用いた精緻な測定により定量化し、日誌と組み合わせて検討することで場面やタイミングを考慮して詳細に解明する。
-得られたデータから健康や労働生産性への影響を探索し、妊婦に適切な睡眠の量や質を確保するための環境整備に資する知見を得る。"
-**Outline of Research Achievement (English)**: "妊婦の睡眠が阻害されると妊娠・出産に重大な悪影響を及ぼすため、適切な睡眠衛生環境 を築くことが重要である。妊婦の夜間睡眠は分断されやすく疲労が蓄積しやすい。効果的な昼寝をとることにより回復を促せる可能性がある一方、過度な昼寝は夜間の睡眠を障害する可能性もある。しかし従来の研究は日常生活下の連続的な睡眠測定が不十分であった。
-本研究は昼寝を含めた妊婦の睡眠実態を睡眠計を用いた精緻な測定により定量化し、日誌と組み合わせて検討することで場面やタイミングを考慮して詳細に解明する。
-得られたデータから健康や労働生産性への影響を探索し、妊婦に適切な睡眠の量や質を確保するための環境整備に資する知見を得る。"
-**Outline of Annual Research Achievements**: "妊婦の睡眠が阻害されると妊娠・出産に重大な悪影響を及ぼすため、適切な睡眠衛生環境 を築くことが重要である。妊婦の夜間睡眠は分断されやすく疲労が蓄積しやすい。効果的な昼寝をとることにより回復を促せる可能性がある一方、過度な昼寝は夜間の睡眠を障害する可能性もある。しかし従来の研究は日常生活下の連続的な睡眠測定が不十分であった。
-本研究は昼寝を含めた妊婦の睡眠実態を睡眠計を用いた精緻な測定により定量化し、日誌と組み合わせて検討することで場面やタイミングを考慮して詳細に解明する。
-得られたデータから健康や労働生産性への影響を探索し、妊婦に適切な睡眠の量や質を確保するための環境整備に資する知見を得る。"
-**Research Progress Status**: "妊婦の睡眠が阻害されると妊娠・出産に重大な悪影響を及ぼすため、適切な睡眠衛生環境 を築くことが重要である。妊婦の夜間睡眠は分断されやすく疲労が蓄積しやすい。効果的な昼寝をとることにより回復を促せる可能性がある一方、過度な昼寝は夜間の睡眠を障害する可能性もある。しかし従来の研究は日常生活下の連続的な睡眠測定が不十分であった。
-本研究は昼寝を含めた妊婦の睡眠実態を睡眠計を用いた精緻な測定により定量化し、日誌と組み合わせて検討することで場面やタイミングを考慮して詳細に解明する。
-得られたデータから健康や労働生産性への影響を探索し、妊婦に適切な睡眠の量や質を確保するための環境整備に資する知見を得る。"
-**Strategy for Future Research Activity**: "妊婦の睡眠が阻害されると妊娠・出産に重大な悪影響を及ぼすため、適切な睡眠衛生環境 を築くことが重要である。妊婦の夜間睡眠は分断されやすく疲労が蓄積しやすい。効果的な昼寝をとることにより回復を促せる可能性がある一方、過度な昼寝は夜間の睡眠を障害する可能性もある。しかし従来の研究は日常生活下の連続的な睡眠測定が不十分であった。
-本研究は昼寝を含めた妊婦の睡眠実態を睡眠計を用いた精緻な測定により定量化し、日誌と組み合わせて検討することで場面やタイミングを考慮して詳細に解明する。
-得られたデータから健康や労働生産性への影響を探索し、妊婦に適切な睡眠の量や質を確保するための環境整備に資する知見を得る。"
-**Expenditure Plans for the Next FY Research Funding**: "妊婦の睡眠が阻害されると妊娠・出産に重大な悪影響を及ぼすため、適切な睡眠衛生環境 を築くことが重要である。妊婦の夜間睡眠は分断されやすく疲労が蓄積しやすい。効果的な昼寝をとることにより回復を促せる可能性がある一方、過度な昼寝は夜間の睡眠を障害する可能性もある。しかし従来の研究は日常生活下の連続的な睡眠測定が不十分であった。
-本研究は昼寝を含めた妊婦の睡眠実態を睡眠計を用いた精緻な測定により定量化し、日誌と組み合わせて検討することで場面やタイミングを考慮して詳細に解明する。
-得られたデータから健康や労働生産性への影響を探索し、妊婦に適切な睡眠の量や質を確保するための環境整備に資する知見を得る。"
-**Causes of Carryover**: "妊婦の睡眠が阻害されると妊娠・出産に重大な悪影響を及ぼすため、適切な睡眠衛生環境 を築くことが重要である。妊婦の夜間睡眠は分断されやすく疲労が蓄積しやすい。効果的な昼寝をとることにより回復を促せる可能性がある一方、過度な昼寝は夜間の睡眠を障害する可能性もある。しかし従来の研究は日常生活下の連続的な睡眠測定が不十分であった。
-本研究は昼寝を含めた妊婦の睡眠実態を睡眠計を用いた精緻な測定により定量化し、日誌と組み合わせて検討することで場面やタイミングを考慮して詳細に解明する。
-得られたデータから健康や労働生産性への影響を探索し、妊婦に適切な睡眠の量や質を確保するための環境整備に資する知見を得る。"
-**Expenditure Plan for Carryover Budget**: "妊婦の睡眠が阻害されると妊娠・出産に重大な悪影響を及ぼすため、適切な睡眠衛生環境 を築くことが重要である。妊婦の夜間睡眠は分断されやすく疲労が蓄積しやすい。効果的な昼寝をとることにより回復を促せる可能性がある一方、過度な昼寝は夜間の睡眠を障害する可能性もある。しかし従来の研究は日常生活下の連続的な睡眠測定が不十分であった。
-本研究は昼寝を含めた妊婦の睡眠実態を睡眠計を用いた精緻な測定により定量化し、日誌と組み合わせて検討することで場面やタイミングを考慮して詳細に解明する。
-得られたデータから健康や労働生産性への影響を探索し、妊婦に適切な睡眠の量や質を確保するための環境整備に資する知見を得る。"
-**Free Research Field**: "妊婦の睡眠が阻害されると妊娠・出産に重大な悪影響を及ぼすため、適切な睡眠衛生環境 を築くことが重要である。妊婦の夜間睡眠は分断されやすく疲労が蓄積しやすい。効果的な昼寝をとることにより回復を促せる可能性がある一方、過度な昼寝は夜間の睡眠を障害する可能性もある。しかし従来の研究は日常生活下の連続的な睡眠測定が不十分であった。
-本研究は昼寝を含めた妊婦の睡眠実態を睡眠計を用いた精緻な測定により定量化し、日誌と組み合わせて検討することで場面やタイミングを考慮して詳細に解明する。
-得られたデータから健康や労働生産性への影響を探索し、妊婦に適切な睡眠の量や質を確保するための環境整備に資する知見を得る。"
-**Assessment Rating**: "妊婦の睡眠が阻害されると妊娠・出産に重大な悪影響を及ぼすため、適切な睡眠衛生環境 を築くことが重要である。妊婦の夜間睡眠は分断されやすく疲労が蓄積しやすい。効果的な昼寝をとることにより回復を促せる可能性がある一方、過度な昼寝は夜間の睡眠を障害する可能性もある。しかし従来の研究は日常生活下の連続的な睡眠測定が不十分であった。
-本研究は昼寝を含めた妊婦の睡眠実態を睡眠計を用いた精緻な測定により定量化し、日誌と組み合わせて検討することで場面やタイミングを考慮して詳細に解明する。
-得られたデータから健康や労働生産性への影響を探索し、妊婦に適切な睡眠の量や質を確保するための環境整備に資する知見を得る。"
-**Remarks**: "妊婦の睡眠が阻害されると妊娠・出産に重大な悪影響を及ぼすため、適切な睡眠衛生環境 を築くことが重要である。妊婦の夜間睡眠は分断されやすく疲労が蓄積しやすい。効果的な昼寝をとることにより回復を促せる可能性がある一方、過度な昼寝は夜間の睡眠を障害する可能性もある。しかし従来の研究は日常生活下の連続的な睡眠測定が不十分であった。
-本研究は昼寝を含めた妊婦の睡眠実態を睡眠計を用いた精緻な測定により定量化し、日誌と組み合わせて検討することで場面やタイミングを考慮して詳細に解明する。
-得られたデータから健康や労働生産性への影響を探索し、妊婦に適切な睡眠の量や質を確保するための環境整備に資する知見を得る。"
+**Indirect Cost (Breakdown)**: <BREAKDOWN_TEXT>
+**Progress Status (Status Code)**: <BREAKDOWN_TEXT>
+**Current Status of Research Progress**: <BREAKDOWN_TEXT>
+**Reason**: <BREAKDOWN_TEXT>
+**Outline of Research at the Start**: <ABSTRACT_TEXT>
+**Research Abstract**: <ABSTRACT_TEXT>
+**Research Abstract (English)**: <ABSTRACT_TEXT>
+**Outline of Final Research Achievements**: <ABSTRACT_TEXT>
+**Outline of Research Achievement (English)**: <ABSTRACT_TEXT>
+**Outline of Annual Research Achievements**: <ABSTRACT_TEXT>
+**Research Progress Status**: <ABSTRACT_TEXT>
+**Strategy for Future Research Activity**: <ABSTRACT_TEXT>
+**Expenditure Plans for the Next FY Research Funding**: <ABSTRACT_TEXT>
+**Causes of Carryover**: <ABSTRACT_TEXT>
+**Expenditure Plan for Carryover Budget**: <ABSTRACT_TEXT>
+**Free Research Field**: <ABSTRACT_TEXT>
+**Assessment Rating**: <ABSTRACT_TEXT>
+**Remarks**: <ABSTRACT_TEXT>
 **Int'l Joint Research**: "0"
 **Funded Workshop**: "0"
 **Journal Article**: "0"